@@ -4,21 +4,32 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import importlib.util
 import logging
+import multiprocessing
+import os
 import re
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from datetime import date, datetime, timedelta
+from html import unescape
+from typing import TYPE_CHECKING, Literal
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
-from dateparser.date import DateDataParser
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from discord import ButtonStyle, Embed, Interaction
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import Button, View
 
-from utils.tools import get_soup_hack, text_or_none
+from utils.decorators import async_retry
+from utils.french_dates import parse_release_period
+from utils.http_client import HttpClient
+from utils.release_index import IndexedRelease, ReleaseIndex
+from utils.swr_cache import SWRCache
+from utils.tools import text_or_none, to_bool
 
 if TYPE_CHECKING:
     from bs4.element import AttributeValueList
@@ -29,13 +40,66 @@ logger = logging.getLogger(__name__)
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36",  # noqa: E501
 }
-ddp = DateDataParser(languages=["fr"])
-
 DAY = timedelta(days=1)
 WEEK = timedelta(days=7)
 MONTH = timedelta(days=31)
 QUARTER = timedelta(days=91)
 
+# Shown when a page of the calendar could not be fetched
+UNAVAILABLE = "jeuxvideo.com ne répond pas, réessaie dans quelques minutes."
+
+# Release date of the games whose date could not be parsed
+UNKNOWN_DATE = date(3000, 1, 1)
+Day = date  # the classes below have a ``date`` field, which shadows the type
+
+# Page fetches: retry on timeout, and hedge the slowest ones
+FETCH_TRIES = 2
+HEDGE_QUANTILE = 0.9
+
+# HTML parser backend: lxml (C) when installed, else the pure-Python one
+PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Page parsing pool: threads, or processes with JV_PARSE_PROCESSES > 0 (each one
+# imports this module, and discord.py with it: count ~40 MB per process)
+PARSE_PROCESSES = int(os.getenv("JV_PARSE_PROCESSES", "0"))
+PARSE_THREADS = 2
+_parse_pool: Executor | None = None
+
+_NEXT_LINK = re.compile(r"<a\b[^>]*pagination__button--next[^>]*>", re.IGNORECASE)
+_HREF = re.compile(r"""\bhref\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+# Shared HTTP client (owned by the bot, see use_http_client)
+http_client: HttpClient | None = None
+
+# Parsed month pages: fresh for an hour, served stale (and refreshed) for a day
+MONTH_TTL = 3600
+MONTH_MAX_STALE = 24 * 3600
+# Month pages scraped concurrently, and longest custom range
+MONTH_CONCURRENCY = 4
+MAX_MONTHS = 12
+
+# Background release index: months crawled from the current one (0 disables it),
+# and refresh period. Answers from an index older than MONTH_MAX_STALE are not used.
+INDEX_FILE = os.getenv("JV_INDEX_FILE", ".cache/jv/releases.sqlite3")
+INDEX_MONTHS = int(os.getenv("JV_INDEX_MONTHS", "4"))
+INDEX_REFRESH_HOURS = float(os.getenv("JV_INDEX_REFRESH_HOURS", "6"))
+PLATFORMS = ("Toutes", "PS5", "Xbox", "Switch", "PC")
+
+# Derive the platform lists from the "Toutes" pages (one crawl instead of five):
+# the platforms of each game are matched locally, Switch 1 and 2 included
+DERIVE_PLATFORMS = to_bool(os.getenv("JV_DERIVE_PLATFORMS", "true"), strict=False)
+PLATFORM_NAMES = {
+    "PC": re.compile(r"pc"),
+    "PS5": re.compile(r"ps5|playstation 5"),
+    "Xbox": re.compile(r"xbox series.*"),
+    "Switch": re.compile(r"(nintendo )?switch( 2)?"),
+}
+_PLATFORMS_PREFIX = re.compile(r"^\s*plateformes?\s*:\s*", re.IGNORECASE)
+_PLATFORMS_SEP = re.compile(r"\s*(?:[,;|•·]|\s-\s)\s*")
+
+# Release index (owned by the cog, see use_release_index)
+release_index: ReleaseIndex | None = None
+
 
 @dataclass
 class NewGame:
@@ -44,6 +108,8 @@ class NewGame:
     This class encapsulates basic information about a game and provides a formatted
     string representation. The release date is parsed from a raw string and converted
     to a `datetime.date` object. If parsing fails, a default placeholder date is used.
+    A partial date ("Octobre 2026") is a period: `date` is its first day and
+    `date_end` its last.
     """
 
     name: str
@@ -53,18 +119,34 @@ class NewGame:
 
     url: str = field(init=False)
     date: date = field(init=False)
+    date_end: Day = field(init=False)
+    platform_set: frozenset[str] = field(init=False)
 
     def __post_init__(self) -> None:
         self.url = urljoin("https://www.jeuxvideo.com", self.part_url)
-        self.date = self._parse_release_date(self.release)
+        self.date, self.date_end = self._parse_release_period(self.release)
+        self.platform_set = parse_platforms(self.platforms)
+
+    def on_platform(self, platform: str) -> bool:
+        """True if the game is announced on ``platform`` (a button label)."""
+        if platform == "Toutes":
+            return True
+        pattern = PLATFORM_NAMES[platform]
+        return any(pattern.fullmatch(name) for name in self.platform_set)
+
+    def released_between(self, start: Day, end: Day) -> bool:
+        """True if the game is released from ``start`` to ``end`` (both included).
+
+        A period ("Octobre 2026") is only listed by the windows holding its last
+        day: a month is scraped in full only up to there (see ``_past``), so an
+        earlier window would list it or not depending on the cache.
+        """
+        return start <= self.date_end <= end
 
     @staticmethod
-    def _parse_release_date(release: str) -> date:
-        try:
-            date_str = re.sub("Sortie: ", "", release)
-            return ddp.get_date_data(date_str).date_obj.date()  # type: ignore
-        except AttributeError:
-            return date(3000, 1, 1)
+    def _parse_release_period(release: str | None) -> tuple[Day, Day]:
+        parsed = parse_release_period(release) if release else None
+        return parsed if parsed is not None else (UNKNOWN_DATE, UNKNOWN_DATE)
 
     def __str__(self) -> str:
         return (
@@ -77,8 +159,51 @@ class NewGame:
         )
 
 
+def parse_platforms(platforms: str) -> frozenset[str]:
+    """Parse the platforms shown on a game card ("Plateformes : PC, PS5, Switch 2").
+
+    Returns:
+        frozenset[str]: The lowercased platform names (empty for "no platform").
+    """
+    if platforms == "no platform":
+        return frozenset()
+    text = _PLATFORMS_PREFIX.sub("", platforms)
+    return frozenset(name.lower() for name in _PLATFORMS_SEP.split(text) if name)
+
+
+def source_platform(platform: str) -> str:
+    """Platform whose pages are crawled to list the games of ``platform``."""
+    return "Toutes" if DERIVE_PLATFORMS else platform
+
+
+def games_embeds(games: list[NewGame], title: str, updated: datetime | None = None) -> list[Embed]:
+    """Build the embeds listing ``games`` (25 fields per embed).
+
+    With ``updated`` (the games come from the release index), its date is shown
+    in the footer of the last embed.
+    """
+    embeds = []
+    current_embed = Embed(title=title)
+    for game in games:
+        if len(current_embed.fields) >= 25:
+            embeds.append(current_embed)
+            current_embed = Embed(title="Suite de la liste")
+
+        if game.platforms != "no platform":
+            value = f"{game.release}\n{game.platforms}\n{game.url}"
+        else:
+            value = f"{game.release}\n{game.url}"
+
+        current_embed.add_field(name=game.name, value=value, inline=False)
+
+    if updated is not None:
+        current_embed.set_footer(text=f"Calendrier mis à jour le {updated:%d/%m/%Y à %H:%M}")
+    embeds.append(current_embed)  # Ajoute le dernier embed
+    return embeds
+
+
 class TimeButton(Button):
-    """Class for the buttons 'Jour', 'Semaine', 'Mois'"""
+    """Class for the buttons 'Jour', 'Semaine', 'Mois', 'Trimestre'"""
 
     def __init__(self, label: str, row: int, delta: timedelta, embedtitle: str) -> None:
         """Each button has his own label, row, timedelta and embed title"""
@@ -97,29 +222,22 @@ class TimeButton(Button):
         await interaction.response.edit_message(view=self.view)
 
         full_title = f"{self.title} sur {platform}" if one_platform else self.title
-        embeds = []
-        current_embed = Embed(title=full_title)
-
-        # this command takes TIME, so warn the user !
-        await interaction.followup.send(content="ça va prendre du temps ! c'est normal !")
-
-        games = await fetch_time_delta(self.delta, platform=platform)
-
-        for game in games:
-            if len(current_embed.fields) >= 25:
-                embeds.append(current_embed)
-                current_embed = Embed(title="Suite de la liste")
-
-            if game.platforms != "no platform":
-                value = f"{game.release}\n{game.platforms}\n{game.url}"
-            else:
-                value = f"{game.release}\n{game.url}"
-
-            current_embed.add_field(name=game.name, value=value, inline=False)
 
-        embeds.append(current_embed)  # Ajoute le dernier embed
-
-        for embed in embeds:
+        today = date.today()
+        end = today + self.delta
+        if (indexed := await index_range(today, end, platform=platform)) is not None:
+            games, updated = indexed
+        else:
+            # this command takes TIME when the months are not cached, so warn the user !
+            if not months_cached(platform, today, end):
+                await interaction.followup.send(content="ça va prendre du temps ! c'est normal !")
+            try:
+                games, updated = await fetch_range(today, end, platform=platform), None
+            except (TimeoutError, aiohttp.ClientError):
+                await interaction.followup.send(content=UNAVAILABLE)
+                return
+
+        for embed in games_embeds(games, full_title, updated):
             await interaction.followup.send(embed=embed)
 
 
@@ -135,6 +253,89 @@ class PlatformButton(Button):
         await interaction.response.edit_message(view=self.view)
 
 
+def _is_card(classes: str | None) -> bool:
+    return classes is not None and "gameMetadata" in classes
+
+
+# Only build the game cards read by scrape_page (the "next page" link is found in
+# the raw HTML, see next_page_url)
+GAME_CARDS = SoupStrainer(class_=_is_card)
+
+
+def make_soup(
+    html: str, parser: str = PARSER, only: SoupStrainer | None = GAME_CARDS
+) -> BeautifulSoup:
+    """Parse a release page.
+
+    Args:
+        html (str): The page.
+        parser (str): bs4 parser backend ("lxml", "html.parser"...).
+        only (SoupStrainer | None): Subtrees to build (None: the whole page).
+
+    Returns:
+        BeautifulSoup: The soup of the game cards.
+    """
+    return BeautifulSoup(html, parser, parse_only=only)
+
+
+def use_http_client(client: HttpClient) -> None:
+    """Set the HTTP client used to fetch the pages."""
+    global http_client
+    http_client = client
+
+
+@async_retry(
+    tries=FETCH_TRIES,
+    delay=1,
+    max_delay=5,
+    backoff=1.5,
+    jitter=(0, 0.5),
+    exceptions=(asyncio.TimeoutError,),
+    hedge_quantile=HEDGE_QUANTILE,
+)
+async def fetch_page(url: str) -> str:
+    """Fetch a page (retried on timeout, hedged when slow).
+
+    Raises:
+        aiohttp.ClientError: Connection error or HTTP error status.
+        TimeoutError: Still timing out after the retries.
+    """
+    if http_client is None:
+        raise RuntimeError("No HTTP client, call use_http_client() first")
+    try:
+        return await http_client.get_text(url)
+    except aiohttp.ClientError as exc:
+        logger.warning("Impossible de récupérer %s : %s", url, exc)
+        raise
+
+
+def parse_pool() -> Executor:
+    """Return the pool parsing the pages (created on first use)."""
+    global _parse_pool
+    if _parse_pool is None:
+        if PARSE_PROCESSES:
+            _parse_pool = ProcessPoolExecutor(
+                PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            _parse_pool = ThreadPoolExecutor(PARSE_THREADS, thread_name_prefix="jv-parse")
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def next_page_url(html: str, url: str) -> str | None:
+    """URL of the "next page" link of a page, found with a regex (no parsing)."""
+    if (tag := _NEXT_LINK.search(html)) and (href := _HREF.search(tag[0])):
+        return urljoin(url, unescape(href[1]))
+    return None
+
+
 def _unbloat_title(title: Tag | None) -> None:
     with contextlib.suppress(AttributeError):
         if em := title.find("em"):
@@ -207,7 +408,7 @@ def generate_url(month: int, year: int, platform: str = "Toutes") -> str | None:
     elif platform == "PS5":
         return f"https://www.jeuxvideo.com/jeux/sorties/machine-22/annee-{year}/mois-{month}/"
     elif platform == "Switch":
-        # TODO : ça ne fait que la switch 2, pas la 1, faudrait améliorer ça
+        # TODO : ça ne fait que la switch 2, pas la 1 (JV_DERIVE_PLATFORMS couvre les deux)
         return f"https://www.jeuxvideo.com/jeux/sorties/machine-42/annee-{year}/mois-{month}/"
     elif platform == "Xbox":
         return f"https://www.jeuxvideo.com/jeux/sorties/machine-32/annee-{year}/mois-{month}/"
@@ -238,12 +439,12 @@ def _get_platform(tag: Tag) -> str:
     Returns:
         str: the platform the game will be available
     """
-    try:
-        tmp = text_or_none(tag.select_one("div.cardGameList__gamePlatforms"))
-        platform = f"Plateformes :\t {tmp}"
-    except AttributeError:
-        platform = "no platform"
-    return platform
+    if (platforms := tag.select_one("div.cardGameList__gamePlatforms")) is None:
+        return "no platform"
+    # one text node per platform on some cards: keep them apart, without the
+    # separator nodes ("/", "-") between them
+    names = [text for text in platforms.stripped_strings if any(c.isalnum() for c in text)]
+    return f"Plateformes :\t {', '.join(names)}"
 
 
 # def _extract_release_date(html: Tag) -> str:
@@ -276,7 +477,7 @@ def _extract_game_href(html: Tag) -> str | AttributeValueList | None:
     return None
 
 
-async def scrape_page(soup: BeautifulSoup) -> list[NewGame]:
+def scrape_page(soup: BeautifulSoup) -> list[NewGame]:
     """Scrape a page on JV, for month releases.
 
     Args:
@@ -313,63 +514,269 @@ async def scrape_page(soup: BeautifulSoup) -> list[NewGame]:
     return releases
 
 
+def parse_page(html: str) -> list[NewGame]:
+    """Parse a release page into games (CPU-bound: runs in the parse pool)."""
+    return scrape_page(make_soup(html))
+
+
 async def scrape_all_pages(
-    start_url: str, process_page_callback: Callable[[BeautifulSoup], Awaitable[list]]
+    start_url: str,
+    parse_page_callback: Callable[[str], list],
+    stop: Callable[[list], bool] | None = None,
 ) -> list:
     """Parcourt toutes les pages d'une pagination à partir d'une URL complète (version async).
 
+    Chaque page est analysée dans le pool de parsing (`parse_pool`), pendant que la
+    page suivante est téléchargée : la boucle d'événements n'est jamais bloquée.
+
     Args:
         start_url (str): L'URL complète de la première page (ex. "https://www.jeuxvideo.com/jeux/sorties/annee-2026/?p=1").
-        process_page_callback (Callable[[BeautifulSoup], Awaitable[List]]):
-            Une fonction async qui prend un objet BeautifulSoup et retourne une liste d'éléments extraits.
+        parse_page_callback (Callable[[str], List]):
+            Une fonction (synchrone, picklable) qui prend le HTML d'une page et retourne une liste d'éléments extraits.
+        stop (Callable[[List], bool], optional):
+            Appelée avec les éléments de chaque page ; si elle renvoie True, les
+            pages suivantes ne sont pas parcourues.
 
     Returns:
         List: Une liste contenant tous les éléments extraits de toutes les pages.
+
+    Raises:
+        aiohttp.ClientError, TimeoutError: Une page n'a pas pu être récupérée (pas
+            de résultat partiel : une liste tronquée serait prise pour le mois complet).
     """  # noqa: E501
-    current_url: str | None = start_url
-    visited = set()
+    loop = asyncio.get_running_loop()
+    current_url = start_url
+    visited = {start_url}
     all_results = []
 
-    while current_url and current_url not in visited:
+    logger.info(f"Scraping {current_url}")
+    html = await fetch_page(current_url)
+    while True:
+        next_url = next_page_url(html, current_url)
+        if next_url in visited:
+            next_url = None
+        parsing = loop.run_in_executor(parse_pool(), parse_page_callback, html)
+        # download the next page while this one is parsed
+        fetching = asyncio.create_task(fetch_page(next_url)) if next_url else None
+        if fetching is not None:  # its error is raised when awaited, or dropped if cancelled
+            fetching.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            page_results = await parsing
+        except BaseException:
+            if fetching is not None:
+                fetching.cancel()
+            raise
+
+        all_results.extend(page_results)
+        if stop is not None and stop(page_results):
+            if fetching is not None:
+                fetching.cancel()
+            logger.info("Arrêt de la pagination après %s", current_url)
+            break
+        if fetching is None or next_url is None:
+            break
+        current_url = next_url
         visited.add(current_url)
         logger.info(f"Scraping {current_url}")
-        soup = await get_soup_hack(current_url)
+        html = await fetching
 
-        page_results = await process_page_callback(soup) if soup else None
-        if isinstance(page_results, list):
-            all_results.extend(page_results)
-        else:
-            logger.info("⚠️ La fonction de traitement n'a pas retourné une liste.")
+    return all_results
 
-        next_link = soup.select_one(".pagination__button--next") if soup else None
-        if next_link and "href" in next_link.attrs:
-            current_url = urljoin(current_url, next_link["href"])
-        else:
-            current_url = None
 
-    return all_results
+@dataclass(frozen=True)
+class MonthGames:
+    """Games of a month, complete or only up to ``until`` (early stop)."""
+
+    games: list[NewGame]
+    until: date | None = None  # None: the whole month
+
+    def covers(self, end: date | None) -> bool:
+        """True if the games up to ``end`` (None: the whole month) are all here."""
+        return self.until is None or (end is not None and end <= self.until)
+
 
+def _past(end: date) -> Callable[[list[NewGame]], bool]:
+    """Stop condition: the page (sorted by release date) goes past ``end``."""
+    return lambda games: any(end < game.date != UNKNOWN_DATE for game in games)
 
-async def fetch_month(url: str) -> list[NewGame]:
-    """Fetch all games in a month, even if there are several pages."""
+
+async def fetch_month(url: str, until: date | None = None) -> list[NewGame]:
+    """Fetch all games in a month, even if there are several pages.
+
+    With ``until``, the pages after the first one going past this date are not
+    fetched (the listing is sorted by release date).
+    """
     logger.debug("fetch_month url : %s", url)
-    return await scrape_all_pages(start_url=url, process_page_callback=scrape_page)
+    return await scrape_all_pages(
+        start_url=url,
+        parse_page_callback=parse_page,
+        stop=_past(until) if until is not None else None,
+    )
+
+
+# (platform, year, month) -> games of the month
+month_cache: SWRCache[tuple[str, int, int], MonthGames] = SWRCache(
+    ttl=MONTH_TTL, max_stale=MONTH_MAX_STALE
+)
+
+
+# bounds the month pages scraped at once (button clicks and background refreshes)
+_month_fetches = asyncio.Semaphore(MONTH_CONCURRENCY)
+
+
+def months_between(start: date, end: date) -> list[tuple[int, int]]:
+    """Return the (month, year) tuples from ``start`` to ``end``, both included."""
+    months = []
+    month, year = start.month, start.year
+    while (year, month) <= (end.year, end.month):
+        months.append((month, year))
+        month, year = next_month(month, year)
+    return months
+
+
+def months_cached(platform: str, start: date, end: date) -> bool:
+    """True if the games from ``start`` to ``end`` can be served from the cache."""
+    source = source_platform(platform)
+    return all(
+        (cached := month_cache.peek((source, y, m))) is not None and cached.covers(end)
+        for m, y in months_between(start, end)
+    )
+
+
+async def fetch_month_cached(
+    month: int, year: int, platform: str = "Toutes", until: date | None = None
+) -> list[NewGame]:
+    """Fetch the games of a month, from the cache when possible (stale-while-revalidate).
+
+    With ``until`` (in this month), the scrape stops at this date: the day and
+    week views only fetch the first pages. The cached month remembers how far it
+    goes, and is scraped again further when a longer window needs it.
+
+    In the JV_DERIVE_PLATFORMS mode, the "Toutes" month is fetched (and cached)
+    once, and the games of ``platform`` are filtered from it.
+    """
+    source = source_platform(platform)
+    url = generate_url(month, year, platform=source)
+    if until is not None and (until.year, until.month) != (year, month):
+        until = None  # the window goes beyond this month
+
+    key = (source, year, month)
+
+    async def load() -> MonthGames:
+        # never narrower than the cached month (a stale refresh, or a reload for a
+        # longer window, must not replace a full month by its first days)
+        wide = until
+        if wide is not None and (current := month_cache.peek(key)) is not None:
+            wide = None if current.until is None else max(wide, current.until)
+        async with _month_fetches:
+            return MonthGames(await fetch_month(url, until=wide), wide)
+
+    cached = await month_cache.get(key, load, accept=lambda m: m.covers(until))
+    if source == platform:
+        return cached.games
+    return [game for game in cached.games if game.on_platform(platform)]
+
+
+async def fetch_range(start: date, end: date, platform: str = "Toutes") -> list[NewGame]:
+    """Fetch games released from ``start`` to ``end`` (all the months concurrently).
+
+    A game with a partial date ("Octobre 2026") is kept if its period ends in the range.
+    """
+    months = await asyncio.gather(
+        *(
+            fetch_month_cached(m, y, platform=platform, until=end)
+            for m, y in months_between(start, end)
+        )
+    )
+    return [game for games in months for game in games if game.released_between(start, end)]
+
+
+def use_release_index(index: ReleaseIndex | None) -> None:
+    """Set the release index answering the queries (None: always scrape)."""
+    global release_index
+    release_index = index
+
+
+def _index_lookup(
+    index: ReleaseIndex, start: date, end: date, platform: str
+) -> tuple[list[NewGame], datetime] | None:
+    source = source_platform(platform)
+    updated = index.updated(source, months_between(start, end))
+    if updated is None or time.time() - updated > MONTH_MAX_STALE:
+        return None
+    games = [
+        NewGame(name=r.name, release=r.release, platforms=r.platforms, part_url=r.part_url)
+        for r in index.between(source, start, end)
+    ]
+    return [game for game in games if game.on_platform(platform)], datetime.fromtimestamp(updated)
+
+
+async def index_range(
+    start: date, end: date, platform: str = "Toutes"
+) -> tuple[list[NewGame], datetime] | None:
+    """Games released from ``start`` to ``end``, from the release index.
+
+    Returns:
+        tuple[list[NewGame], datetime] | None: The games and the date of the
+        oldest crawl they come from, or None if the index does not cover the
+        range (or is too old).
+    """
+    if release_index is None:
+        return None
+    return await asyncio.to_thread(_index_lookup, release_index, start, end, platform)
+
+
+async def index_month(month: int, year: int, platform: str) -> None:
+    """Crawl a whole month and store its games in the release index.
+
+    Raises:
+        aiohttp.ClientError, TimeoutError: A page could not be fetched (the
+            previous rows of the month are kept).
+    """
+    if release_index is None:
+        return
+    url = generate_url(month, year, platform=platform)
+    async with _month_fetches:
+        games = await fetch_month(url)  # raises on a failed page: the rows are kept
+    rows = [
+        IndexedRelease(g.name, g.release, g.platforms, g.part_url, g.date, g.date_end)
+        for g in games
+    ]
+    await asyncio.to_thread(release_index.replace_month, platform, year, month, rows)
+
+
+async def refresh_index(months: int = INDEX_MONTHS) -> None:
+    """Crawl the next ``months`` months of every platform into the release index.
+
+    In the JV_DERIVE_PLATFORMS mode, only the "Toutes" pages are crawled. The
+    months are crawled one at a time (nearest first), so the clicks on the
+    buttons still get their share of the month fetches.
+    """
+    if release_index is None:
+        return
+    today = date.today()
+    month, year = today.month, today.year
+    logger.info("Index : rafraîchissement de %d mois", months)
+    platforms = {source_platform(platform) for platform in PLATFORMS}
+    for _ in range(months):
+        for platform in sorted(platforms):
+            try:
+                await index_month(month, year, platform)
+            except (TimeoutError, aiohttp.ClientError) as exc:
+                logger.warning("Index : échec de %s %02d/%d : %s", platform, month, year, exc)
+            except Exception:  # SQLite, parsing bug...: never stop the refresh loop
+                logger.exception("Index : erreur sur %s %02d/%d", platform, month, year)
+        month, year = next_month(month, year)
+    try:
+        await asyncio.to_thread(release_index.prune, today.year, today.month)
+    except Exception:
+        logger.exception("Index : échec du nettoyage des mois passés")
 
 
 async def fetch_time_delta(delta: timedelta, platform: str = "Toutes") -> list[NewGame]:
     """Fetch games in a time delta relative to today(one week, one month, etc...)"""
     today = date.today()
-    int_month: int = today.month
-    int_year: int = today.year
-
-    url = generate_url(today.month, today.year, platform=platform)
-    logger.debug("fetch_time_delta url : %s", url)
-    games = await fetch_month(url)
-    # next month
-    new_month, new_year = next_month(int_month, int_year)
-    url = generate_url(new_month, new_year, platform=platform)
-    games += await fetch_month(url)
-    return [game for game in games if (diff := game.date - today) <= delta and diff.days >= 0]
+    return await fetch_range(today, today + delta, platform=platform)
 
 
 class JV(commands.Cog):
@@ -377,6 +784,25 @@ class JV(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        use_http_client(bot.http_client)  # type: ignore[attr-defined]
+        self.index = ReleaseIndex(INDEX_FILE) if INDEX_MONTHS > 0 else None
+        use_release_index(self.index)
+
+    async def cog_load(self) -> None:
+        if self.index is not None:
+            self.index_loop.start()
+
+    async def cog_unload(self) -> None:
+        self.index_loop.cancel()
+        use_release_index(None)
+        if self.index is not None:
+            self.index.close()
+        shutdown_parse_pool()
+
+    @tasks.loop(hours=INDEX_REFRESH_HOURS)
+    async def index_loop(self) -> None:
+        """Keep the release index of the next months up to date."""
+        await refresh_index()
 
     @commands.hybrid_command()
     async def sorties(self, ctx: Context) -> None:
@@ -395,6 +821,9 @@ class JV(commands.Cog):
         button1 = TimeButton(label="Jour", row=1, delta=DAY, embedtitle="Sorties du jour")
         button2 = TimeButton(label="Semaine", row=1, delta=WEEK, embedtitle="Sorties de la semaine")
         button3 = TimeButton(label="Mois", row=1, delta=MONTH, embedtitle="Sorties du mois")
+        button4 = TimeButton(
+            label="Trimestre", row=1, delta=QUARTER, embedtitle="Sorties du trimestre"
+        )
 
         view.add_item(platbutton1)
         view.add_item(platbutton2)
@@ -404,9 +833,46 @@ class JV(commands.Cog):
         view.add_item(button1)
         view.add_item(button2)
         view.add_item(button3)
+        view.add_item(button4)
 
         await ctx.send(view=view)
 
+    @commands.hybrid_command()
+    async def sorties_entre(
+        self,
+        ctx: Context,
+        debut: str,
+        fin: str,
+        plateforme: Literal["Toutes", "PS5", "Xbox", "Switch", "PC"] = "Toutes",
+    ) -> None:
+        """Sorties entre deux dates (JJ/MM/AAAA), 12 mois maximum."""
+        try:
+            start = datetime.strptime(debut, "%d/%m/%Y").date()
+            end = datetime.strptime(fin, "%d/%m/%Y").date()
+        except ValueError:
+            await ctx.send("Dates invalides : utilise le format JJ/MM/AAAA.", ephemeral=True)
+            return
+        if end < start:
+            start, end = end, start
+        if len(months_between(start, end)) > MAX_MONTHS:
+            await ctx.send(f"Période trop longue : {MAX_MONTHS} mois maximum.", ephemeral=True)
+            return
+
+        await ctx.defer(ephemeral=False)
+        if (indexed := await index_range(start, end, platform=plateforme)) is not None:
+            games, updated = indexed
+        else:
+            try:
+                games, updated = await fetch_range(start, end, platform=plateforme), None
+            except (TimeoutError, aiohttp.ClientError):
+                await ctx.send(UNAVAILABLE)
+                return
+        title = f"Sorties du {start:%d/%m/%Y} au {end:%d/%m/%Y}"
+        if plateforme != "Toutes":
+            title += f" sur {plateforme}"
+        for embed in games_embeds(games, title, updated):
+            await ctx.send(embed=embed)
+
 
 async def setup(bot):
     "Add the cog to the bot."
@@ -417,7 +883,8 @@ async def setup(bot):
 if __name__ == "__main__":
     logger.setLevel(logging.DEBUG)
 
-    def print_page_title(soup):
+    def print_page_title(html):
+        soup = make_soup(html, only=None)
         try:
             title = soup.title.string.strip() if soup.title else "Sans titre"
             print("Titre de la page :", title)
@@ -426,6 +893,7 @@ if __name__ == "__main__":
             return []
 
     async def main():
+        use_http_client(HttpClient())
         # url = generate_url(10, 2025, "PC")
         # url = "https://www.jeuxvideo.com/jeux/sorties/machine-22/annee-2025/mois-10/"
         # url = "https://www.jeuxvideo.com/jeux/sorties/machine-32/annee-2025/mois-10/"
@@ -1,16 +1,55 @@
 """Lemonde -> PDF cog."""
 
 import asyncio
+import contextlib
+import functools
+import io
 import logging
 import os
-
-# from typing import Literal
-from discord import File, Interaction, Message, app_commands  # noqa: F401
-from discord.ext import commands  # noqa: F401
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from datetime import date
+from typing import Literal
+
+import aiohttp
+from discord import (  # noqa: F401
+    Embed,
+    File,
+    HTTPException,
+    Interaction,
+    Message,
+    NotFound,
+    app_commands,
+)
+from discord.ext import commands, tasks  # noqa: F401
+from discord.ui import Button, View
 from dotenv import load_dotenv
-from lemonde_sl import LeMondeAsync, MyArticle
 
-from utils.decorators import async_retry
+from utils.decorators import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    LatencyTracker,
+    RetryBudget,
+    async_retry,
+)
+from utils.lemonde_preview import ArticlePreview, fetch_preview
+from utils.lemonde_worker import RenderedArticle, RenderPool, fit_article, render_article
+from utils.pdf_cache import CachedArticle, PdfCache
+from utils.pdf_delivery import (
+    DEFAULT_UPLOAD_LIMIT,
+    SpillJanitor,
+    close_files,
+    pack_attachments,
+    pdf_digest,
+    pdf_file,
+    pdf_size,
+)
+from utils.scheduler import FairScheduler, OnUpdate, SchedulerError
+from utils.singleflight import SingleFlight
+from utils.tools import canonical_url, to_bool
+from utils.upload_index import UploadIndex, UploadRecord
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -25,6 +64,67 @@ BACKOFF = 1.2
 # JITTER = 0
 JITTER = (0, 1)
 
+# Circuit breaker / retry budget, shared by all the /lemonde calls
+BREAKER_THRESHOLD = 5  # failures...
+BREAKER_WINDOW = 120  # ...in this many seconds open the circuit
+BREAKER_COOLDOWN = 60  # seconds before a trial call
+RETRY_RATIO = 0.2  # at most 20 % of the calls may be retries
+# Hedged requests (e.g. 0.9): only useful with LEMONDE_RENDER_PROCESSES >= 2, since the
+# second attempt needs a free render process. The losing render is not stopped: it
+# keeps its process (and its CPU) until it finishes
+HEDGE_QUANTILE = float(os.getenv("LEMONDE_HEDGE_QUANTILE", "0")) or None
+
+# PDF cache
+CACHE_DIR = os.getenv("LEMONDE_CACHE_DIR", ".cache/lemonde")
+CACHE_TTL = int(os.getenv("LEMONDE_CACHE_TTL", str(24 * 3600)))  # seconds
+CACHE_MAX_MB = int(os.getenv("LEMONDE_CACHE_MAX_MB", "200"))
+
+# Authenticated session
+COOKIE_FILE = os.getenv("LEMONDE_COOKIE_FILE", os.path.join(CACHE_DIR, "cookies.pickle"))
+SESSION_MAX_AGE = int(os.getenv("LEMONDE_SESSION_MAX_AGE", str(12 * 3600)))  # seconds
+
+# Working directory of the renders, kept under a disk quota
+SPILL_DIR = os.getenv("LEMONDE_SPILL_DIR", os.path.join(CACHE_DIR, "spill"))
+SPILL_QUOTA_MB = int(os.getenv("LEMONDE_SPILL_QUOTA_MB", "50"))
+
+# Previous uploads, linked again instead of uploading the same PDFs
+UPLOAD_INDEX_FILE = os.getenv("LEMONDE_UPLOAD_INDEX", os.path.join(CACHE_DIR, "uploads.json"))
+REUSE_MAX_AGE = int(os.getenv("LEMONDE_REUSE_MAX_AGE", str(7 * 24 * 3600)))  # seconds
+
+# Speculative prefetch of the links posted in chat (opt-in)
+PREFETCH = to_bool(os.getenv("LEMONDE_PREFETCH", "false"), strict=False)
+PREFETCH_CONCURRENCY = int(os.getenv("LEMONDE_PREFETCH_CONCURRENCY", "1"))
+PREFETCH_DAILY_BUDGET = int(os.getenv("LEMONDE_PREFETCH_DAILY_BUDGET", "30"))
+LEMONDE_URL_RE = re.compile(r"https?://(?:www\.)?lemonde\.fr/[^\s<>|]+?\.html")
+
+# Text preview shown while the PDF renders
+PREVIEW = to_bool(os.getenv("LEMONDE_PREVIEW", "true"), strict=False)
+PREVIEW_TIMEOUT = float(os.getenv("LEMONDE_PREVIEW_TIMEOUT", "5"))  # seconds
+PREVIEW_VIEW_TIMEOUT = 30 * 60  # seconds the page buttons stay active
+
+# Image optimization of the rendered PDFs (LEMONDE_IMAGE_DPI=0 to disable)
+IMAGE_DPI = int(os.getenv("LEMONDE_IMAGE_DPI", "150"))
+IMAGE_QUALITY = int(os.getenv("LEMONDE_IMAGE_QUALITY", "75"))
+IMAGE_CACHE_DIR = os.getenv("LEMONDE_IMAGE_CACHE_DIR", os.path.join(CACHE_DIR, "images"))
+IMAGE_CACHE_MB = int(os.getenv("LEMONDE_IMAGE_CACHE_MB", "50"))
+
+# Render processes
+RENDER_PROCESSES = int(os.getenv("LEMONDE_RENDER_PROCESSES", "1"))
+RENDER_MAX_TASKS_PER_CHILD = int(os.getenv("LEMONDE_RENDER_MAX_TASKS_PER_CHILD", "10"))
+
+# Job queue
+WORKERS = int(os.getenv("LEMONDE_WORKERS", "1"))
+MAX_QUEUE = int(os.getenv("LEMONDE_MAX_QUEUE", "20"))
+MAX_JOBS_PER_USER = int(os.getenv("LEMONDE_MAX_JOBS_PER_USER", "2"))
+
+# Several articles in one command
+BATCH_MAX = int(os.getenv("LEMONDE_BATCH_MAX", "5"))
+# never more concurrent jobs than the per-user quota of the job queue allows
+BATCH_CONCURRENCY = min(int(os.getenv("LEMONDE_BATCH_CONCURRENCY", "2")), MAX_JOBS_PER_USER)
+
+# A PDF ready to be sent: freshly rendered (in memory) or from the cache (on disk)
+Article = RenderedArticle | CachedArticle
+
 
 # async def get_article(url: str, mobile: bool, dark_mode: bool) -> MyArticle:
 #     """
@@ -76,25 +176,96 @@ JITTER = (0, 1)
 #         )
 
 
-async def get_article(url: str) -> list[MyArticle]:
+def site_failure(exc: BaseException) -> bool:
+    """True if ``exc`` tells that Le Monde is failing (network, timeout, 5xx).
+
+    The other errors (page that is not an article, missing credentials...) come
+    from the request or from the bot: they must not open the shared circuit breaker.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(exc, (TimeoutError, aiohttp.ClientError, ConnectionError))
+
+
+def variant_key(url: str, mobile: bool, dark_mode: bool) -> str:
+    """Cache / single-flight key of one layout of the canonical ``url``."""
+    if not mobile and not dark_mode:
+        return url
+    return f"{url}#{'mobile' if mobile else 'normal'}-{'dark' if dark_mode else 'clair'}"
+
+
+async def get_article(
+    url: str, pool: RenderPool, mobile: bool = False, dark_mode: bool = False
+) -> list[RenderedArticle]:
+    """Generate the PDFs of a Le Monde article in a worker of ``pool``.
+
+    The event loop only waits for the result: fetching and WeasyPrint rendering
+    run in the worker process (see ``utils.lemonde_worker``).
+
+    Args:
+        url (str): The URL of the Le Monde article to fetch.
+        pool (RenderPool): Pool of render processes.
+        mobile (bool): Whether to render the article using the mobile layout
+            (A6 format, reduced margins).
+        dark_mode (bool): Whether to apply the dark theme to the generated PDF.
+
+    Returns:
+        list[RenderedArticle]: The generated PDFs.
+    """
     # Load environment variables (idempotent)
     load_dotenv()
 
-    EMAIL = os.getenv("LM_SL_EMAIL")
-    PASSWORD = os.getenv("LM_SL_PASSWD")
     MAX_IMGS: int = int(os.getenv("LM_SL_MAX_IMGS"))
     logger.info("get_article called with url=%s and max imgs=%d", url, MAX_IMGS)
 
-    if not EMAIL or not PASSWORD:
-        raise RuntimeError("Missing LM_SL_EMAIL or LM_SL_PASSWD in environment")
-    async with LeMondeAsync() as lm:
-        my_pdf_list: list[MyArticle] = await lm.fetch_all_pdf(
-            url=url,
-            email=EMAIL,
-            password=PASSWORD,
-            max_img=MAX_IMGS,
+    return await pool.run(render_article, url, MAX_IMGS, mobile, dark_mode)
+
+
+class PageButton(Button):
+    """Previous / next page of a :class:`PreviewView`."""
+
+    def __init__(self, label: str, step: int) -> None:
+        super().__init__(label=label)
+        self.step = step
+
+    async def callback(self, interaction: Interaction) -> None:
+        view: PreviewView = self.view  # type: ignore[assignment]
+        view.page = (view.page + self.step) % len(view.embeds)
+        await interaction.response.edit_message(embed=view.embeds[view.page])
+
+
+class MarkdownButton(Button):
+    """Send the whole preview as a Markdown file."""
+
+    def __init__(self, preview: ArticlePreview) -> None:
+        super().__init__(label="📝 Texte (.md)")
+        self.preview = preview
+
+    async def callback(self, interaction: Interaction) -> None:
+        data = io.BytesIO(self.preview.to_markdown().encode("utf-8"))
+        name = self.preview.url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".html") or "article"
+        await interaction.response.send_message(
+            file=File(data, filename=f"{name}.md"), ephemeral=True
         )
-    return my_pdf_list
+
+
+class PreviewView(View):
+    """Paginated text preview of an article (one embed per page)."""
+
+    def __init__(self, preview: ArticlePreview) -> None:
+        super().__init__(timeout=PREVIEW_VIEW_TIMEOUT)
+        pages = preview.pages() or ["*(texte indisponible)*"]
+        self.embeds = [
+            Embed(title=preview.title[:256], url=preview.url, description=page).set_footer(
+                text=f"Aperçu texte — page {i}/{len(pages)}"
+            )
+            for i, page in enumerate(pages, start=1)
+        ]
+        self.page = 0
+        if len(self.embeds) > 1:
+            self.add_item(PageButton("◀", -1))
+            self.add_item(PageButton("▶", 1))
+        self.add_item(MarkdownButton(preview))
 
 
 class LeMonde(commands.Cog):
@@ -102,34 +273,270 @@ class LeMonde(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.cache = PdfCache(CACHE_DIR, ttl=CACHE_TTL, max_bytes=CACHE_MAX_MB * 1024 * 1024)
+        # one generation at a time per canonical URL, shared by concurrent callers
+        self._inflight: SingleFlight[str, list[RenderedArticle]] = SingleFlight()
+        self._background: set[asyncio.Task] = set()
+        self.uploads = UploadIndex(UPLOAD_INDEX_FILE, max_age=REUSE_MAX_AGE)
+        self.janitor = SpillJanitor(SPILL_DIR, quota_bytes=SPILL_QUOTA_MB * 1024 * 1024)
+        self.pool = RenderPool(
+            processes=RENDER_PROCESSES,
+            max_tasks_per_child=RENDER_MAX_TASKS_PER_CHILD,
+            cookie_file=COOKIE_FILE,
+            session_max_age=SESSION_MAX_AGE,
+            work_dir=SPILL_DIR,
+            image_dpi=IMAGE_DPI,
+            image_quality=IMAGE_QUALITY,
+            image_cache_dir=IMAGE_CACHE_DIR,
+        )
+        self.image_janitor = SpillJanitor(
+            IMAGE_CACHE_DIR, quota_bytes=IMAGE_CACHE_MB * 1024 * 1024, max_age=7 * 24 * 3600
+        )
+        self.scheduler = FairScheduler(
+            workers=WORKERS, max_queue=MAX_QUEUE, max_per_user=MAX_JOBS_PER_USER
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=BREAKER_THRESHOLD, window=BREAKER_WINDOW, cooldown=BREAKER_COOLDOWN
+        )
+        self.retry_budget = RetryBudget(ratio=RETRY_RATIO, window=BREAKER_WINDOW)
+        self.latency = LatencyTracker()
+        self._prefetching = 0
+        self._prefetch_day = date.today()
+        self._prefetch_count = 0
+        self.ctx_menu = app_commands.ContextMenu(
+            name="Télécharger (Le Monde)", callback=self.lemonde_message
+        )
 
-    @app_commands.command(name="lemonde", description="Télécharge un article du Monde")
-    @app_commands.describe(
-        url="URL de l'article à télécharger",
-        # mode="Choisir mobile et/ou dark theme",
-    )
-    async def lemonde(
+    async def cog_load(self) -> None:
+        self.bot.tree.add_command(self.ctx_menu)
+        self.scheduler.start()
+        self.janitor_loop.start()
+
+    async def cog_unload(self) -> None:
+        self.bot.tree.remove_command(self.ctx_menu.name, type=self.ctx_menu.type)
+        self.janitor_loop.cancel()
+        await self.scheduler.close()
+        self.pool.shutdown()
+
+    @tasks.loop(minutes=10)
+    async def janitor_loop(self) -> None:
+        """Keep the spill directory and the image cache under their disk quota."""
+        await asyncio.to_thread(self.janitor.sweep)
+        await asyncio.to_thread(self.image_janitor.sweep)
+
+    async def _generate(
+        self, key: str, fetch: Callable[[], Awaitable[list[RenderedArticle]]]
+    ) -> list[RenderedArticle]:
+        """Generate with ``fetch()`` the PDFs of the cache key ``key``.
+
+        The PDFs are returned in memory, so they can be sent right away; they are
+        written to the cache in the background.
+        """
+        generated = await fetch()
+        logger.info("PDFs généré avec succès")
+        task = asyncio.create_task(asyncio.to_thread(self.cache.put, key, generated))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return generated
+
+    @commands.Cog.listener()
+    async def on_message(self, message: Message) -> None:
+        """Pre-render in the background the Le Monde articles posted in chat."""
+        if not PREFETCH or message.author.bot:
+            return
+        for url in dict.fromkeys(LEMONDE_URL_RE.findall(message.content)):
+            key = canonical_url(url)
+            if key in self.cache or self._inflight.in_flight(key):
+                continue
+            if self.breaker.state is not CircuitState.CLOSED:
+                return  # don't prefetch from a failing site
+            if not self._prefetch_allowed():
+                return
+            task = asyncio.create_task(self._prefetch(key))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _prefetch_allowed(self) -> bool:
+        """Check (and consume) the prefetch concurrency cap and daily budget."""
+        if (today := date.today()) != self._prefetch_day:
+            self._prefetch_day, self._prefetch_count = today, 0
+        if self._prefetching >= PREFETCH_CONCURRENCY:
+            return False
+        if self._prefetch_count >= PREFETCH_DAILY_BUDGET:
+            logger.info("Budget de préchargement du jour épuisé")
+            return False
+        self._prefetch_count += 1
+        self._prefetching += 1  # released by _prefetch
+        return True
+
+    async def _prefetch(self, key: str) -> None:
+        """Render ``key`` into the cache with a low priority (slot taken by _prefetch_allowed)."""
+        logger.info("Préchargement de %s", key)
+        fetch = functools.partial(get_article, key, pool=self.pool)
+        try:
+            await self._inflight.do(
+                key,
+                lambda: self.scheduler.submit_background(
+                    lambda: self._generate(key, fetch), tag=key
+                ),
+            )
+        except Exception as exc:
+            logger.warning("Échec du préchargement de %s : %s", key, exc)
+        finally:
+            self._prefetching -= 1
+
+    async def _fit(self, article: Article, max_bytes: int) -> list[Article]:
+        """Recompress / split (in the render pool) a PDF bigger than ``max_bytes``."""
+        if pdf_size(article) <= max_bytes:
+            return [article]
+        if isinstance(article, CachedArticle):
+            data = await asyncio.to_thread(article.path.read_bytes)
+            article = RenderedArticle(article.filename, data, article.warning)
+        logger.info("%s trop lourd pour Discord, recompression", article.filename)
+        parts = await self.pool.run(fit_article, article, max_bytes)
+        return list(parts)
+
+    async def _iter_fitted(
+        self, articles: Sequence[Article], max_bytes: int
+    ) -> AsyncIterator[list[Article]]:
+        """Yield, in order, each PDF fitted to ``max_bytes`` as soon as it is ready.
+
+        All the PDFs are fitted concurrently, so the first one can be uploaded
+        while the next ones are still being recompressed.
+        """
+        tasks = [asyncio.create_task(self._fit(article, max_bytes)) for article in articles]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _upload(
         self,
         interaction: Interaction,
-        url: str,
-        # mode: Literal[
-        #     "Normal Clair", "Normal Dark", "Mobile Clair", "Mobile Dark"
-        # ] = "Normal Clair",
+        parts: Sequence[tuple[int, Article]],
+        limit: int,
+        sent_in: list[list[Message]],
     ) -> None:
+        """Send ``(article index, PDF)`` pairs in as few messages as the limits allow."""
+        sizes = [pdf_size(part) for _, part in parts]
+        for group in pack_attachments(sizes, limit):
+            files: list[File] = []  # File is discord.File
+            try:
+                files = [pdf_file(parts[i][1]) for i in group]
+                message = await interaction.followup.send(files=files, wait=True)
+            finally:
+                close_files(files)
+            for index in dict.fromkeys(parts[i][0] for i in group):
+                sent_in[index].append(message)
+        warnings = [part.warning for _, part in parts if part.warning]
+        if warnings:
+            await interaction.followup.send("\n".join(warnings))
+
+    async def _send_articles(
+        self,
+        interaction: Interaction,
+        articles: Sequence[Article],
+        progress: Message | None = None,
+        pack: bool = False,
+    ) -> list[list[Message]]:
+        """Upload the PDFs (and their warnings) in as few messages as possible.
+
+        The PDFs that fit in the upload limit are ready at once, so they are sent
+        together. Only while a PDF too big for Discord is being recompressed, the
+        PDFs before it are uploaded without waiting for it, and ``progress`` is
+        edited after each upload. With ``pack`` (batches), all the PDFs are
+        fitted first, then sent together.
+
+        Returns:
+            list[list[Message]]: For each PDF of ``articles``, the messages holding it.
         """
-        Télécharge un article depuis Lemonde.fr et l'affiche dans Discord.
+        limit = interaction.guild.filesize_limit if interaction.guild else DEFAULT_UPLOAD_LIMIT
+        limit = int(limit * 0.98)  # margin for the multipart overhead
+
+        oversized = [pdf_size(article) > limit for article in articles]
+        sent_in: list[list[Message]] = [[] for _ in articles]
+        parts: list[tuple[int, Article]] = []
+        index = 0
+        async for fitted in self._iter_fitted(articles, limit):
+            parts += [(index, part) for part in fitted]
+            index += 1
+            # the next PDF is ready unless it has to be recompressed
+            if index < len(articles) and (pack or not oversized[index]):
+                continue
+            await self._upload(interaction, parts, limit, sent_in)
+            parts = []
+            if progress is not None and index < len(articles):
+                with contextlib.suppress(HTTPException):
+                    await progress.edit(content=f"📤 PDF {index}/{len(articles)} envoyé…")
+        return sent_in
+
+    async def _previous_upload(
+        self, interaction: Interaction, key: str, cached: Sequence[Article] | None
+    ) -> str | None:
+        """Link the previous upload of ``key`` in this channel, if it is still there.
+
+        The upload is not reused if the cache holds a different version of the
+        PDFs (the article was rendered again since).
+
+        Returns:
+            str | None: The message pointing to the previous upload.
+        """
+        channel = interaction.channel
+        if channel is None or not hasattr(channel, "fetch_message"):
+            return None
+        record = self.uploads.get(channel.id, key)
+        if record is None:
+            return None
+        if cached is not None and tuple(pdf_digest(a) for a in cached) != record.digests:
+            return None
 
-        Args:
-            interaction(discord.Interaction): L'interaction Discord.
-            url (str): Lien vers l'article.
-            mobile (Literal["Oui", "Non"]): Mode mobile.
-            dark_mode (Literal["Oui", "Non"]): Mode sombre.
+        try:
+            messages = [await channel.fetch_message(mid) for mid in record.message_ids]
+        except NotFound:
+            logger.info("Envoi précédent de %s supprimé, nouvel envoi", key)
+            self.uploads.discard(channel.id, key)
+            return None
+        except HTTPException as exc:  # no read history permission, Discord hiccup...
+            logger.info("Envoi précédent de %s invérifiable : %s", key, exc)
+            return None
+        attachments = [a for message in messages for a in message.attachments]
+        if not attachments:
+            self.uploads.discard(channel.id, key)
+            return None
+
+        # fetched messages carry freshly signed attachment URLs
+        content = f"♻️ Déjà envoyé ici : {record.jump_url}"
+        for attachment in attachments:
+            line = f"\n📎 [{attachment.filename}](<{attachment.url}>)"
+            if len(content) + len(line) > 2000:
+                break
+            content += line
+        logger.info("Envoi précédent de %s réutilisé", key)
+        return content
+
+    async def _record_upload(
+        self, key: str, articles: Sequence[Article], messages: Sequence[Message]
+    ) -> None:
+        """Remember the messages holding the PDFs of ``key``."""
+        messages = list({message.id: message for message in messages}.values())
+        if not messages:
+            return
+        digests = await asyncio.to_thread(lambda: tuple(pdf_digest(a) for a in articles))
+        record = UploadRecord(
+            channel_id=messages[0].channel.id,
+            message_ids=tuple(message.id for message in messages),
+            jump_url=messages[0].jump_url,
+            digests=digests,
+            uploaded=time.time(),
+        )
+        self.uploads.put(key, record)
 
-        Comportement :
-            - Affiche les paramètres reçus dans un message de suivi.
-            - Tente de récupérer l'article avec plusieurs essais en cas de timeout.
-            - Utilise `to_bool()` pour convertir les paramètres en booléens.
-        """
+    def _retrying_get_article(
+        self, interaction: Interaction
+    ) -> Callable[[str, bool, bool], Awaitable[list[RenderedArticle]]]:
+        """Return ``get_article`` with the retry policy of /lemonde for this interaction."""
 
         # --- CALLBACK POUR LE RETRY ---
         async def retry_callback(attempt, delay, exc):
@@ -147,57 +554,317 @@ class LeMonde(commands.Cog):
             jitter=JITTER,
             exceptions=(asyncio.exceptions.TimeoutError,),
             on_retry=retry_callback,
+            breaker=self.breaker,
+            counts_as_failure=site_failure,
+            budget=self.retry_budget,
+            hedge_quantile=HEDGE_QUANTILE,
+            hedge_tracker=self.latency,
         )
-        # async def retry_get_article(url, mobile, dark_mode):
-        #     return await get_article(url=url, mobile=mobile, dark_mode=dark_mode)
-        async def retry_get_article(url: str) -> list[MyArticle]:
-            return await get_article(url=url)
+        async def retry_get_article(
+            url: str, mobile: bool, dark_mode: bool
+        ) -> list[RenderedArticle]:
+            return await get_article(url=url, pool=self.pool, mobile=mobile, dark_mode=dark_mode)
 
+        return retry_get_article  # type: ignore[no-any-return]
+
+    async def _render(
+        self,
+        interaction: Interaction,
+        key: str,
+        fetch: Callable[[], Awaitable[list[RenderedArticle]]],
+        on_update: OnUpdate | None = None,
+    ) -> list[RenderedArticle]:
+        """Render ``key`` through the job queue, shared with concurrent requests.
+
+        Raises:
+            CircuitOpenError: Le Monde is failing, the call is refused.
+            SchedulerError: The queue (or the user's quota) is full.
+        """
+        # refused while open, and while the half-open trial runs (unless it's this article)
+        if not self.breaker.accepting and not self._inflight.in_flight(key):
+            raise CircuitOpenError(self.breaker.retry_after)
+        guild_id, user_id = interaction.guild_id or 0, interaction.user.id
+        if self.scheduler.promote(key, guild_id, user_id, on_update):
+            # prefetched article still waiting: it becomes this user's job
+            logger.info("Préchargement de %s promu pour %s", key, user_id)
+        return await self._inflight.do(
+            key,
+            lambda: self.scheduler.submit(
+                guild_id=guild_id,
+                user_id=user_id,
+                func=lambda: self._generate(key, fetch),
+                on_update=on_update,
+            ),
+        )
+
+    async def _show_preview(self, url: str, message: Message) -> bool:
+        """Show the text of ``url`` in ``message`` while its PDF renders.
+
+        Returns:
+            bool: True if the preview was shown.
+        """
+        try:
+            preview = await asyncio.wait_for(fetch_preview(url, COOKIE_FILE), PREVIEW_TIMEOUT)
+        except Exception as exc:  # the PDF is still coming: never fail the command
+            logger.info("Aperçu texte indisponible pour %s : %r", url, exc)
+            return False
+        if preview is None:
+            return False
+        view = PreviewView(preview)
+        await message.edit(embed=view.embeds[0], view=view)
+        return True
+
+    @staticmethod
+    async def _close_wait(message: Message, preview: asyncio.Task[bool] | None) -> None:
+        """Delete the waiting message, or only its status line if it shows a preview."""
+        if preview is not None and not preview.done():
+            preview.cancel()
+        shown = (
+            preview is not None
+            and preview.done()
+            and not preview.cancelled()
+            and preview.exception() is None
+            and preview.result()
+        )
+        with contextlib.suppress(HTTPException):
+            if shown:
+                await message.edit(content=None)
+            else:
+                await message.delete()
+
+    @app_commands.command(name="lemonde", description="Télécharge un ou des articles du Monde")
+    @app_commands.describe(
+        url="URL de l'article à télécharger (ou plusieurs, séparées par des espaces)",
+        mode="Choisir mobile et/ou dark theme",
+    )
+    async def lemonde(
+        self,
+        interaction: Interaction,
+        url: str,
+        mode: Literal[
+            "Normal Clair", "Normal Dark", "Mobile Clair", "Mobile Dark"
+        ] = "Normal Clair",
+    ) -> None:
+        """
+        Télécharge un article depuis Lemonde.fr et l'affiche dans Discord.
+
+        Args:
+            interaction(discord.Interaction): L'interaction Discord.
+            url (str): Lien vers l'article (ou plusieurs liens séparés par des espaces).
+            mode (Literal[...]): Mise en page (normal / mobile A6) et thème (clair / dark).
+
+        Comportement :
+            - Affiche les paramètres reçus dans un message de suivi.
+            - Tente de récupérer l'article avec plusieurs essais en cas de timeout.
+            - Chaque mise en page est mise en cache séparément : seule la variante
+              demandée est générée.
+            - Pendant la génération, le message d'attente affiche le texte de
+              l'article (aperçu paginé), puis les PDF sont envoyés.
+            - Avec plusieurs liens, les articles sont traités en lot (voir `_batch`).
+        """
         # --- PARAMÈTRES ---
-        # mobile = "Mobile" in mode
-        # dark_mode = "Dark" in mode
+        mobile = "Mobile" in mode
+        dark_mode = "Dark" in mode
 
         await interaction.response.defer(ephemeral=False)
 
+        urls = list(dict.fromkeys(LEMONDE_URL_RE.findall(url)))
+        if len(urls) > 1:
+            await self._batch(interaction, urls, mobile, dark_mode)
+            return
+        if not urls:  # refused before the queue and the circuit breaker
+            await interaction.followup.send(
+                "❌ Ce n'est pas un lien d'article du Monde (https://www.lemonde.fr/….html)."
+            )
+            return
+        url = urls[0]
+
         logger.info("Commande /lemonde appelée avec url=%s", url)
 
         await interaction.followup.send(
-            # f"📄 Article: {url}\n📱 Mobile: {mobile}\n🌙 Mode sombre: {dark_mode}"
-            f"📄 Article: {url}"
+            f"📄 Article: {url}\n📱 Mobile: {mobile}\n🌙 Mode sombre: {dark_mode}"
         )
 
         msg_wait: Message = await interaction.followup.send("⏳ Traitement en cours…")  # type: ignore[func-returns-value,assignment]  # noqa: E501
 
+        # --- PROGRESSION DANS LA FILE D'ATTENTE ---
+        async def on_queue_update(position: int, eta: float) -> None:
+            if position:
+                await msg_wait.edit(
+                    content=f"⏳ En file d’attente : position {position} (~{eta:.0f}s)…"
+                )
+            else:
+                await msg_wait.edit(content="⏳ Traitement en cours…")
+
+        # --- CACHE ---
+        article_url = canonical_url(url)
+        key = variant_key(article_url, mobile, dark_mode)
+        articles: Sequence[Article] | None = self.cache.get(key)
+        if articles is not None:
+            logger.info(
+                "Cache hit pour %s (hits=%d, misses=%d)",
+                key,
+                self.cache.stats.hits,
+                self.cache.stats.misses,
+            )
+
+        # --- ENVOI PRÉCÉDENT ---
+        if (previous := await self._previous_upload(interaction, key, articles)) is not None:
+            await interaction.followup.send(previous)
+            await msg_wait.delete()
+            logger.info("------------------")
+            return
+
         # --- APPEL AVEC RETRY ---
+        retry_get_article = self._retrying_get_article(interaction)
+        preview: asyncio.Task[bool] | None = None
         try:
-            # my_article: MyArticle = await retry_get_article(
-            #     url=url, mobile=mobile, dark_mode=dark_mode
-            # )
-            articles: list[MyArticle] = await retry_get_article(url=url)
-            logger.info("PDFs généré avec succès")
+            if articles is None:
+                if PREVIEW and self.breaker.accepting:
+                    preview = asyncio.create_task(self._show_preview(article_url, msg_wait))
+                if self._inflight.in_flight(key):
+                    await msg_wait.edit(content="⏳ Article déjà en cours de génération…")
+                articles = await self._render(
+                    interaction,
+                    key,
+                    lambda: retry_get_article(article_url, mobile, dark_mode),
+                    on_update=on_queue_update,
+                )
+        except SchedulerError as exc:
+            await interaction.followup.send(f"🚦 {exc}")
+            await self._close_wait(msg_wait, preview)
+            return
+        except CircuitOpenError as exc:
+            logger.warning("Circuit Le Monde ouvert, appel refusé")
+            await interaction.followup.send(
+                "🔌 Le Monde ne répond plus pour le moment, "
+                f"réessaie dans {exc.retry_after:.0f} secondes."
+            )
+            await self._close_wait(msg_wait, preview)
+            return
         except Exception as exc:
             logger.error(f"Erreur fatale: {exc}")
             await interaction.followup.send(
                 "❌ Impossible de récupérer l’article après plusieurs tentatives."
             )
-            await msg_wait.delete()
+            await self._close_wait(msg_wait, preview)
             return
 
         # --- ENVOI DU PDF ---
         try:
-            paths = [File(article.path) for article in articles]  # File is discord.File
-
-            await interaction.followup.send(files=paths)
-            for my_article in articles:
-                if my_article.has_warning:
-                    await interaction.followup.send(my_article.warning)
-                os.remove(my_article.path)
-        except (TypeError, FileNotFoundError):
+            sent_in = await self._send_articles(interaction, articles, progress=msg_wait)
+        except (TypeError, FileNotFoundError, HTTPException):
             await interaction.followup.send("Echec de la commande. Réessayez peut-être.")
+        else:
+            await self._record_upload(key, articles, [m for ms in sent_in for m in ms])
         finally:
-            await msg_wait.delete()
+            await self._close_wait(msg_wait, preview)
             logger.info("------------------")
 
+    async def lemonde_message(self, interaction: Interaction, message: Message) -> None:
+        """Menu contextuel : télécharge tous les articles du Monde d'un message."""
+        urls = list(dict.fromkeys(LEMONDE_URL_RE.findall(message.content)))
+        if not urls:
+            await interaction.response.send_message(
+                "Aucun lien lemonde.fr dans ce message.", ephemeral=True
+            )
+            return
+        await interaction.response.defer(ephemeral=False)
+        await self._batch(interaction, urls, mobile=False, dark_mode=False)
+
+    async def _batch(
+        self, interaction: Interaction, urls: Sequence[str], mobile: bool, dark_mode: bool
+    ) -> None:
+        """Render several articles and send them together (the interaction is deferred).
+
+        The articles go through the job queue at most ``BATCH_CONCURRENCY`` at a
+        time, rendered by the same workers (and their logged-in sessions). The
+        PDFs are then packed into as few messages as possible, followed by one
+        summary for the links of previous uploads and the failures.
+        """
+        article_urls = list(dict.fromkeys(canonical_url(u) for u in urls))
+        dropped = len(article_urls) - BATCH_MAX
+        article_urls = article_urls[:BATCH_MAX]
+        keys = [variant_key(u, mobile, dark_mode) for u in article_urls]
+        logger.info("Commande /lemonde en lot : %d articles", len(keys))
+
+        msg_wait: Message = await interaction.followup.send(
+            f"📚 {len(keys)} articles (📱 Mobile: {mobile}, 🌙 Mode sombre: {dark_mode})\n"
+            "⏳ Traitement en cours…",
+            wait=True,
+        )
+        retry_get_article = self._retrying_get_article(interaction)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        done = 0
+
+        async def one(article_url: str, key: str) -> Sequence[Article] | str:
+            nonlocal done
+            cached: Sequence[Article] | None = self.cache.get(key)
+            if (previous := await self._previous_upload(interaction, key, cached)) is not None:
+                return previous
+            if cached is None:
+                async with semaphore:
+                    cached = await self._render(
+                        interaction,
+                        key,
+                        lambda: retry_get_article(article_url, mobile, dark_mode),
+                    )
+            done += 1
+            with contextlib.suppress(HTTPException):
+                await msg_wait.edit(content=f"⏳ {done}/{len(keys)} articles prêts…")
+            return cached
+
+        results = await asyncio.gather(*map(one, article_urls, keys), return_exceptions=True)
+
+        # --- ENVOI DES PDF ---
+        summary: list[str] = []
+        ready: list[tuple[str, Sequence[Article]]] = []
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, str):
+                summary.append(result)
+            elif isinstance(result, SchedulerError):
+                summary.append(f"🚦 {key} : {result}")
+            elif isinstance(result, CircuitOpenError):
+                summary.append(f"🔌 {key} : Le Monde ne répond plus pour le moment.")
+            elif isinstance(result, BaseException):
+                logger.error("Erreur fatale pour %s : %s", key, result)
+                summary.append(f"❌ {key} : impossible de récupérer l’article.")
+            else:
+                ready.append((key, result))
+        if dropped > 0:
+            summary.append(f"✂️ {dropped} lien(s) ignoré(s) : {BATCH_MAX} articles maximum.")
+
+        articles = [article for _, result in ready for article in result]
+        try:
+            sent_in = await self._send_articles(interaction, articles, pack=True)
+        except (TypeError, FileNotFoundError, HTTPException):
+            summary.append("Echec de l'envoi des PDF. Réessayez peut-être.")
+        else:
+            start = 0
+            for key, result in ready:
+                owned = sent_in[start : start + len(result)]
+                await self._record_upload(key, result, [m for ms in owned for m in ms])
+                start += len(result)
+        finally:
+            await msg_wait.delete()
+        for content in summary:
+            await interaction.followup.send(content)
+        logger.info("------------------")
+
+    @commands.command(name="lemonde_cache")
+    @commands.has_any_role("modo", "Admin")
+    async def lemonde_cache(self, ctx: commands.Context) -> None:
+        """Affiche les statistiques du cache PDF de /lemonde."""
+        stats = self.cache.stats
+        await ctx.send(
+            f"🗄️ Cache /lemonde : {len(self.cache)} articles, "
+            f"{self.cache.size / 1024 / 1024:.1f} / {CACHE_MAX_MB} Mo\n"
+            f"✅ hits : {stats.hits} — ❌ misses : {stats.misses} "
+            f"({stats.hit_ratio:.0%}) — ⌛ expirés : {stats.expired} "
+            f"— 🧹 évictions : {stats.evictions}\n"
+            f"📥 File : {self.scheduler.queued} en attente, {self.scheduler.running} en cours"
+        )
+
 
 async def setup(bot):
     """
@@ -234,8 +901,13 @@ if __name__ == "__main__":
     if platform.system() == "Windows":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+    pool = RenderPool(
+        1, 1, COOKIE_FILE, SESSION_MAX_AGE, SPILL_DIR, IMAGE_DPI, IMAGE_QUALITY, IMAGE_CACHE_DIR
+    )
     try:
-        asyncio.run(get_article(URL))
+        asyncio.run(get_article(URL, pool=pool))
     except OSError as e:
         logger.error("Erreur OSError")
         logger.error(e)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,55 @@
+"""The bot: owns the resources shared by the cogs, and loads them."""
+
+import logging
+
+from discord.ext import commands
+
+from utils.http_client import HttpClient
+
+cogs_ext_list = [
+    "cogs.news",
+    "cogs.misc",
+    "cogs.lemonde",
+    "cogs.code",
+    "cogs.jv",
+    "cogs.youtube",
+]
+
+
+class BarmanBot(commands.Bot):
+    """Bot owning the resources shared by the cogs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # pooled HTTP client of the scraping cogs
+        self.http_client = HttpClient()
+
+    async def setup_hook(self) -> None:
+        """A coroutine to be called to setup the bot.
+
+        To perform asynchronous setup after the bot is logged in but before
+        it has connected to the Websocket, overwrite this coroutine.
+
+        This is only called once, in `login`, and will be called before
+        any events are dispatched, making it a better solution than doing such
+        setup in the `~discord.on_ready` event.
+
+        Warning :
+        Since this is called *before* the websocket connection is made therefore
+        anything that waits for the websocket will deadlock, this includes things
+        like :meth:`wait_for` and :meth:`wait_until_ready`.
+        """
+        logging.info("Setup_hook !!!")
+        for ext in cogs_ext_list:
+            await self.load_extension(ext)
+
+    async def on_ready(self) -> None:
+        """Log in Discord."""
+        logging.info("Logged in as")
+        logging.info(self.user.name)  # type: ignore
+        logging.info(self.user.id)  # type: ignore
+        await self.tree.sync()
+
+    async def close(self) -> None:
+        await super().close()
+        await self.http_client.close()
@@ -1,7 +1,10 @@
 import asyncio
 import os
 import random
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from enum import Enum
 from functools import wraps  # noqa: F401
 from typing import ParamSpec, TypeVar
 
@@ -48,6 +51,192 @@ def dev_command(**kwargs):
     return wrapper
 
 
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Circuit ouvert, réessayer dans {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by every call to a flaky service.
+
+    - closed: calls go through; failures are counted over a sliding ``window``.
+    - open: after ``failure_threshold`` failures in the window, calls are
+      refused (``CircuitOpenError``) for ``cooldown`` seconds.
+    - half-open: after the cool-down, one trial call goes through; its success
+      closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold (int): Failures in the window that open the circuit.
+        window (float): Length of the failure window, in seconds.
+        cooldown (float): Time the circuit stays open, in seconds.
+    """
+
+    def __init__(self, failure_threshold: int = 5, window: float = 60.0, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._failures: deque[float] = deque()
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at < self.cooldown:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def accepting(self) -> bool:
+        """True if a call would go through now (does not consume the half-open trial)."""
+        state = self.state
+        return state is CircuitState.CLOSED or (
+            state is CircuitState.HALF_OPEN and not self._trial_running
+        )
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds before the circuit lets a call through.
+
+        While the half-open trial is running, this is the cool-down: the delay
+        if the trial fails and opens the circuit again.
+        """
+        if self._opened_at is None:
+            return 0.0
+        if self._trial_running:
+            return self.cooldown
+        return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Return True if a call may go through now (consumes the half-open trial)."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures.clear()
+        self._opened_at = None
+        self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Give the half-open trial back, when the trial call was cancelled."""
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+        if self._trial_running or len(self._failures) >= self.failure_threshold:
+            self._opened_at = now
+        self._trial_running = False
+
+
+class RetryBudget:
+    """
+    Global retry budget: at most ``ratio`` of the calls may be retries.
+
+    Calls and retries are counted over a sliding ``window``; ``min_retries``
+    retries are always allowed so a quiet service can still be retried.
+
+    Args:
+        ratio (float): Maximum share of retries (e.g. 0.2 = 20 % of the calls).
+        window (float): Length of the counting window, in seconds.
+        min_retries (int): Retries allowed in the window whatever the ratio.
+    """
+
+    def __init__(self, ratio: float = 0.2, window: float = 60.0, min_retries: int = 3):
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for events in (self._calls, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_call(self) -> None:
+        self._calls.append(time.monotonic())
+
+    def try_retry(self) -> bool:
+        """Return True (and count the retry) if the budget allows one more retry."""
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._calls)):
+            return False
+        self._retries.append(now)
+        return True
+
+
+class LatencyTracker:
+    """
+    Sliding sample of the latencies of successful calls, to compute quantiles.
+
+    Args:
+        size (int): Number of latencies kept.
+        min_samples (int): Samples needed before a quantile is reported.
+    """
+
+    def __init__(self, size: int = 100, min_samples: int = 10):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the ``q`` quantile (0 < q < 1), or None without enough samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _hedged_call(  # noqa: UP047
+    func: Callable[..., Awaitable[T]], args: tuple, kwargs: dict, hedge_after: float
+) -> T:
+    """
+    Run ``func``, and start a second attempt if the first is still running after
+    ``hedge_after`` seconds. The first successful attempt wins, the other one is
+    cancelled (as are both, if the caller is cancelled). If both fail, the first
+    failure is raised.
+    """
+    pending: set[asyncio.Future[T]] = {asyncio.ensure_future(func(*args, **kwargs))}
+    error: BaseException | None = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=hedge_after)
+        if not done:
+            pending.add(asyncio.ensure_future(func(*args, **kwargs)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        assert error is not None
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 def async_retry(
     tries: int,
     delay: float,
@@ -56,6 +245,11 @@ def async_retry(
     jitter: tuple[float, float],
     exceptions: tuple[type[BaseException], ...],
     on_retry: Callable[[int, float, Exception], Awaitable[None]] | None = None,
+    breaker: CircuitBreaker | None = None,
+    counts_as_failure: Callable[[BaseException], bool] | None = None,
+    budget: RetryBudget | None = None,
+    hedge_quantile: float | None = None,
+    hedge_tracker: LatencyTracker | None = None,
 ):
     """
     Retry decorator for asynchronous functions with exponential backoff and optional jitter.
@@ -84,6 +278,27 @@ def async_retry(
             - attempt number (starting at 1),
             - current delay,
             - the caught exception.
+        breaker (CircuitBreaker | None):
+            Optional circuit breaker shared between calls. While it is open, calls
+            fail fast with ``CircuitOpenError`` instead of being attempted.
+        counts_as_failure (Callable[[BaseException], bool] | None):
+            Which exceptions are failures of the service for the ``breaker``
+            (default: all of them). The others (bad input, local errors...) are
+            raised or retried without opening the circuit.
+        budget (RetryBudget | None):
+            Optional retry budget shared between calls. When it is exhausted, the
+            exception is re-raised instead of being retried.
+        hedge_quantile (float | None):
+            Enables hedged requests: when an attempt is still running after this
+            latency quantile (e.g. 0.9) of the previous successful calls, a second
+            attempt is started in parallel; the first to succeed wins and the other
+            is cancelled. Disabled until enough latencies have been recorded.
+            Cancelling an attempt only stops what it awaits: work already handed
+            to an executor (``run_in_executor``) keeps running until it ends.
+        hedge_tracker (LatencyTracker | None):
+            Where the latencies are recorded. Defaults to one tracker per decorated
+            function; pass a shared one when the decorated function is re-created
+            on each call.
 
     Returns:
         Callable:
@@ -92,19 +307,51 @@ def async_retry(
     Raises:
         Exception:
             Re-raises the last caught exception if all retry attempts fail.
+        CircuitOpenError:
+            If the circuit breaker refuses the call.
     """
 
     def decorator(func):
+        tracker = hedge_tracker
+        if hedge_quantile is not None and tracker is None:
+            tracker = LatencyTracker()
+
+        async def attempt(*args, **kwargs):
+            hedge_after = tracker.quantile(hedge_quantile) if tracker and hedge_quantile else None
+            start = time.monotonic()
+            if hedge_after is None:
+                result = await func(*args, **kwargs)
+            else:
+                result = await _hedged_call(func, args, kwargs, hedge_after)
+            if tracker:
+                tracker.record(time.monotonic() - start)
+            return result
+
+        def failed(exc: BaseException) -> None:
+            if breaker is None:
+                return
+            if counts_as_failure is None or counts_as_failure(exc):
+                breaker.record_failure()
+            else:
+                breaker.release_trial()  # says nothing about the service
+
         async def wrapper(*args, **kwargs):
             _tries = tries
             _delay = delay
+            if budget:
+                budget.record_call()
 
             while _tries > 0:
+                if breaker and not breaker.allow():
+                    raise CircuitOpenError(breaker.retry_after)
                 try:
-                    return await func(*args, **kwargs)
+                    result = await attempt(*args, **kwargs)
 
                 except exceptions as exc:
                     _tries -= 1
+                    failed(exc)
+                    if _tries and budget and not budget.try_retry():
+                        raise
 
                     if on_retry:
                         await on_retry(tries - _tries, _delay, exc)
@@ -119,6 +366,20 @@ def async_retry(
                     j = random.uniform(j_min, j_max)
                     _delay = min(max_delay, _delay * backoff + j * _delay)
 
+                except asyncio.CancelledError:
+                    if breaker:
+                        breaker.release_trial()
+                    raise
+
+                except Exception as exc:
+                    failed(exc)
+                    raise
+
+                else:
+                    if breaker:
+                        breaker.record_success()
+                    return result
+
         return wrapper
 
     return decorator
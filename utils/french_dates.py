@@ -0,0 +1,135 @@
+"""Fast parsing of the French release dates shown by jeuxvideo.com.
+
+The formats the site uses ("12 octobre 2025", "1er mars 2026", "Octobre 2025",
+"T1 2026", "2026"...) are parsed by hand; anything else falls back to
+dateparser, which is slow and heavy to import, so it is only imported the first
+time it is needed. Results are memoized per raw string.
+
+Partial dates are periods: "Octobre 2026" is released somewhere between the 1st
+and the 31st of October, so they are parsed as their first and last days (month,
+quarter, semester, year); a full date is a one-day period. The memo is keyed by
+day too, so relative dates understood by dateparser ("demain"...) do not go stale.
+"""
+
+from __future__ import annotations
+
+import calendar
+import logging
+import re
+import unicodedata
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
+logger = logging.getLogger(__name__)
+
+MONTHS = {
+    "janvier": 1,
+    "fevrier": 2,
+    "mars": 3,
+    "avril": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7,
+    "aout": 8,
+    "septembre": 9,
+    "octobre": 10,
+    "novembre": 11,
+    "decembre": 12,
+}
+
+_PREFIX = re.compile(r"^\s*(?:date de )?sortie\s*:?\s*", re.IGNORECASE)
+_DAY_MONTH_YEAR = re.compile(r"^(\d{1,2})(?:er)? ([a-z]+) (\d{4})$")
+_MONTH_YEAR = re.compile(r"^([a-z]+) (\d{4})$")
+_QUARTER = re.compile(r"^(?:t|q)([1-4]) (\d{4})$")
+_SEMESTER = re.compile(r"^s([12]) (\d{4})$")
+_YEAR = re.compile(r"^(\d{4})$")
+
+
+def _normalize(raw: str) -> str:
+    """Lowercase, strip the accents, the "Sortie:" prefix and extra spaces."""
+    text = _PREFIX.sub("", raw)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(text.lower().split())
+
+
+Period = tuple[date, date]  # first and last day
+
+
+def _months(year: int, first: int, last: int) -> Period:
+    """The period from the 1st of month ``first`` to the end of month ``last``."""
+    return date(year, first, 1), date(year, last, calendar.monthrange(year, last)[1])
+
+
+def _fast_parse(text: str) -> Period | None:
+    """Parse the usual formats of a normalized string, or return None."""
+    try:
+        if m := _DAY_MONTH_YEAR.match(text):
+            month = MONTHS.get(m[2])
+            day = date(int(m[3]), month, int(m[1])) if month else None
+            return (day, day) if day else None
+        if m := _MONTH_YEAR.match(text):
+            month = MONTHS.get(m[1])
+            return _months(int(m[2]), month, month) if month else None
+        if m := _QUARTER.match(text):
+            quarter = int(m[1])
+            return _months(int(m[2]), 3 * quarter - 2, 3 * quarter)
+        if m := _SEMESTER.match(text):
+            semester = int(m[1])
+            return _months(int(m[2]), 6 * semester - 5, 6 * semester)
+        if m := _YEAR.match(text):
+            return _months(int(m[1]), 1, 12)
+    except ValueError:  # 31 février...
+        return None
+    return None
+
+
+@lru_cache(maxsize=1)
+def _dateparser() -> DateDataParser:
+    from dateparser.date import DateDataParser  # noqa: PLC0415 (slow import, only if needed)
+
+    logger.info("Chargement de dateparser")
+    return DateDataParser(languages=["fr"], settings={"PREFER_DAY_OF_MONTH": "first"})
+
+
+def parse_release_period(raw: str) -> Period | None:
+    """Parse a French release date into the period it designates.
+
+    Args:
+        raw (str): The date shown on the site, with or without a "Sortie:" prefix.
+
+    Returns:
+        tuple[date, date] | None: The first and last days of the period (the
+        same day twice for a full date), or None if it cannot be parsed.
+    """
+    return _parse(raw, date.today())
+
+
+def parse_release_date(raw: str) -> date | None:
+    """Parse a French release date (first day of the period for a partial date)."""
+    period = parse_release_period(raw)
+    return period[0] if period is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _parse(raw: str, today: date) -> Period | None:
+    # ``today`` is only part of the memo key
+    text = _normalize(raw)
+    if not text:
+        return None
+    if (parsed := _fast_parse(text)) is not None:
+        return parsed
+
+    logger.debug("Date non reconnue, repli sur dateparser : %r", raw)
+    data = _dateparser().get_date_data(_PREFIX.sub("", raw))
+    if data.date_obj is None:
+        return None
+    day = data.date_obj.date()
+    if data.period == "year":
+        return _months(day.year, 1, 12)
+    if data.period == "month":
+        return _months(day.year, day.month, day.month)
+    return day, day
@@ -0,0 +1,142 @@
+"""Shared async HTTP client for the scraping cogs.
+
+One ``aiohttp.ClientSession`` for the whole bot: the connections are pooled and
+kept alive between pages, responses are decompressed on the fly (gzip, deflate,
+and brotli: aiohttp only asks for ``br`` with the ``brotli`` dependency installed),
+and each host gets a minimum interval between two requests so a burst of clicks
+cannot hammer it.
+
+Pages are revalidated with ``If-None-Match`` / ``If-Modified-Since``: when the
+server answers ``304 Not Modified``, the body kept from the previous response is
+returned without being downloaded again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"  # noqa: E501
+
+
+@dataclass
+class _Validated:
+    etag: str | None
+    last_modified: str | None
+    body: str
+
+
+class _HostThrottle:
+    """Space the requests to one host by at least ``interval`` seconds."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            delay = self._next - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next = time.monotonic() + self.interval
+
+
+class HttpClient:
+    """Pooled HTTP client with per-host throttling and conditional requests.
+
+    The session is created on first use (it needs a running event loop).
+
+    Args:
+        limit_per_host (int): Maximum number of connections per host.
+        host_interval (float): Minimum delay between two requests to a host, in seconds.
+        timeout (float): Total timeout of a request, in seconds.
+        max_validated_bytes (int): Total size of the page bodies kept for
+            revalidation (least recently used first out).
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = 4,
+        host_interval: float = 0.25,
+        timeout: float = 20.0,
+        max_validated_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        self.limit_per_host = limit_per_host
+        self.host_interval = host_interval
+        self.timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=5)
+        self.max_validated_bytes = max_validated_bytes
+        self.not_modified = 0  # number of 304 answers
+        self._session: aiohttp.ClientSession | None = None
+        self._throttles: dict[str, _HostThrottle] = {}
+        self._validated: OrderedDict[str, _Validated] = OrderedDict()
+        self._validated_bytes = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=4 * self.limit_per_host,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_text(self, url: str) -> str:
+        """GET ``url`` and return its body, revalidating the previous copy if any.
+
+        Raises:
+            aiohttp.ClientError: Connection error or HTTP error status.
+            asyncio.TimeoutError: The request timed out.
+        """
+        host = urlsplit(url).netloc
+        throttle = self._throttles.setdefault(host, _HostThrottle(self.host_interval))
+        await throttle.wait()
+
+        headers = {}
+        if (previous := self._validated.get(url)) is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        async with self._get_session().get(url, headers=headers) as response:
+            if response.status == 304 and previous is not None:
+                self.not_modified += 1
+                if url in self._validated:
+                    self._validated.move_to_end(url)
+                logger.debug("304 Not Modified : %s", url)
+                return previous.body
+            response.raise_for_status()
+            body = await response.text()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        self._forget(url)
+        if (etag or last_modified) and len(body) <= self.max_validated_bytes:
+            self._validated[url] = _Validated(etag, last_modified, body)
+            self._validated_bytes += len(body)
+            while self._validated_bytes > self.max_validated_bytes:
+                self._forget(next(iter(self._validated)))
+        return body
+
+    def _forget(self, url: str) -> None:
+        if (validated := self._validated.pop(url, None)) is not None:
+            self._validated_bytes -= len(validated.body)
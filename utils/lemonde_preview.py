@@ -0,0 +1,114 @@
+"""Fast text preview of a Le Monde article, shown while its PDF is rendered.
+
+The article page is fetched with a plain aiohttp request, reusing the cookie jar
+persisted by :class:`~utils.lemonde_session.LeMondeSession` (so subscriber
+articles are complete once a worker has logged in), and only the title, the
+standfirst and the paragraphs are extracted: no images, no WeasyPrint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36",  # noqa: E501
+}
+
+# Embed description limit is 4096 characters
+PAGE_CHARS = 4000
+
+
+@dataclass(frozen=True)
+class ArticlePreview:
+    """The text of an article."""
+
+    url: str
+    title: str
+    standfirst: str | None
+    paragraphs: tuple[str, ...]
+
+    def pages(self, max_chars: int = PAGE_CHARS) -> list[str]:
+        """Split the standfirst and the body into pages of at most ``max_chars``."""
+        blocks = [f"*{self.standfirst}*"] if self.standfirst else []
+        blocks += self.paragraphs
+        pages: list[str] = []
+        current = ""
+        for block in blocks:
+            while len(block) > max_chars:  # a single huge paragraph
+                if current:
+                    pages.append(current)
+                    current = ""
+                pages.append(block[:max_chars])
+                block = block[max_chars:]
+            if current and len(current) + 2 + len(block) > max_chars:
+                pages.append(current)
+                current = ""
+            current = f"{current}\n\n{block}" if current else block
+        if current:
+            pages.append(current)
+        return pages
+
+    def to_markdown(self) -> str:
+        """Return the article as a Markdown document."""
+        lines = [f"# {self.title}", "", self.url, ""]
+        if self.standfirst:
+            lines += [f"*{self.standfirst}*", ""]
+        for paragraph in self.paragraphs:
+            lines += [paragraph, ""]
+        return "\n".join(lines)
+
+
+def parse_preview(html: str, url: str) -> ArticlePreview | None:
+    """Extract the text of a Le Monde article page, or None if it has no title."""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.select_one("h1.article__title")
+    if title is None:
+        return None
+    standfirst = soup.select_one("p.article__desc")
+    paragraphs = tuple(
+        text
+        for tag in soup.select("article .article__paragraph, article .article__sub-title")
+        if (text := tag.get_text(" ", strip=True))
+    )
+    return ArticlePreview(
+        url=url,
+        title=title.get_text(" ", strip=True),
+        standfirst=standfirst.get_text(" ", strip=True) if standfirst else None,
+        paragraphs=paragraphs,
+    )
+
+
+async def fetch_preview(url: str, cookie_file: str | Path) -> ArticlePreview | None:
+    """Fetch and extract the text of the Le Monde article ``url``.
+
+    Args:
+        url (str): The (canonical) article URL.
+        cookie_file (str | Path): Cookie jar saved by the Le Monde session, if any.
+
+    Returns:
+        ArticlePreview | None: The text, or None if the page has no article.
+    """
+    jar = aiohttp.CookieJar()
+    if Path(cookie_file).exists():
+        try:
+            jar.load(cookie_file)
+        except Exception as exc:  # corrupted / incompatible pickle
+            logger.warning("Aperçu : cookies Le Monde illisibles : %s", exc)
+
+    async with (
+        aiohttp.ClientSession(headers=HEADERS, cookie_jar=jar) as session,
+        session.get(url) as response,
+    ):
+        response.raise_for_status()
+        html = await response.text()
+
+    # parsing a full article page takes a few tens of ms: keep it off the event loop
+    return await asyncio.to_thread(parse_preview, html, url)
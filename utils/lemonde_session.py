@@ -0,0 +1,186 @@
+"""Long-lived, authenticated ``LeMondeAsync`` client shared by every /lemonde call."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TypeVar
+
+import aiohttp
+from dotenv import load_dotenv
+from lemonde_sl import LeMondeAsync, MyArticle
+
+T = TypeVar("T")
+
+# A call to the client: (client, email, password) -> result; credentials are None once logged in
+ClientCall = Callable[[LeMondeAsync, str | None, str | None], Awaitable[T]]
+
+logger = logging.getLogger(__name__)
+
+
+def _credentials() -> tuple[str, str]:
+    # Load environment variables (idempotent)
+    load_dotenv()
+
+    email = os.getenv("LM_SL_EMAIL")
+    password = os.getenv("LM_SL_PASSWD")
+    if not email or not password:
+        raise RuntimeError("Missing LM_SL_EMAIL or LM_SL_PASSWD in environment")
+    return email, password
+
+
+class LeMondeSession:
+    """Own one ``LeMondeAsync`` client for the whole life of the bot.
+
+    The TCP/TLS connections of the client are reused between articles, and the
+    login round-trip is only paid when the session is new: lemonde_sl logs in
+    when it is given credentials, so they are only passed to the first fetch
+    after a (re)connection. The cookie jar is persisted to ``cookie_file`` so a
+    cold start (or a Fly machine resume) reuses the previous session.
+
+    The session is considered expired after ``max_age`` seconds, or as soon as a
+    fetch fails with anything else than a timeout: the client is then dropped
+    and the next fetch logs in again.
+
+    Args:
+        cookie_file (str | Path): Where to persist the cookie jar.
+        max_age (float): Maximum age of a login, in seconds.
+    """
+
+    def __init__(self, cookie_file: str | Path, max_age: float) -> None:
+        self.cookie_file = Path(cookie_file)
+        self.max_age = max_age
+        self._client: LeMondeAsync | None = None
+        self._logged_in_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def authenticated(self) -> bool:
+        """True if the current login is recent enough to be reused."""
+        return self._logged_in_at is not None and time.time() - self._logged_in_at < self.max_age
+
+    async def fetch_all_pdf(self, url: str, max_img: int) -> list[MyArticle]:
+        """Generate the PDFs of ``url`` with the shared client (see ``LeMondeAsync``)."""
+
+        def call(
+            client: LeMondeAsync, email: str | None, password: str | None
+        ) -> Awaitable[list[MyArticle]]:
+            pending: Awaitable[list[MyArticle]] = client.fetch_all_pdf(
+                url=url, email=email, password=password, max_img=max_img
+            )
+            return pending
+
+        articles: list[MyArticle] = await self._call(call)
+        return articles
+
+    async def fetch_pdf(self, url: str, mobile: bool, dark: bool) -> MyArticle:
+        """Generate one PDF of ``url`` in the mobile (A6) and/or dark layout."""
+
+        def call(
+            client: LeMondeAsync, email: str | None, password: str | None
+        ) -> Awaitable[MyArticle]:
+            pending: Awaitable[MyArticle] = client.fetch_pdf(
+                url=url, email=email, password=password, mobile=mobile, dark=dark
+            )
+            return pending
+
+        article: MyArticle = await self._call(call)
+        return article
+
+    async def reset(self) -> None:
+        """Drop the client and the persisted cookies: the next fetch logs in again."""
+        async with self._lock:
+            await self._reset()
+
+    async def close(self) -> None:
+        """Close the underlying client (the cookie jar stays on disk)."""
+        async with self._lock:
+            await self._close_client()
+
+    # ----------------------------------------------------------------- helpers
+
+    async def _call(self, call: ClientCall[T]) -> T:
+        """Run ``call(client, email, password)``, with credentials only if a login is needed."""
+        async with self._lock:
+            client = await self._get_client()
+            if not self.authenticated:
+                # log in while holding the lock, so concurrent calls don't log in twice
+                return await self._fetch(client, call, login=True)
+        return await self._fetch(client, call, login=False)
+
+    async def _fetch(self, client: LeMondeAsync, call: ClientCall[T], login: bool) -> T:
+        email, password = _credentials() if login else (None, None)
+        try:
+            result = await call(client, email, password)
+        except TimeoutError:
+            raise
+        except Exception:
+            logger.warning("Session Le Monde invalidée après une erreur")
+            if login:  # the lock is already held
+                await self._reset(client)
+            else:
+                async with self._lock:
+                    await self._reset(client)
+            raise
+
+        if login:
+            logger.info("Connecté à Le Monde, sauvegarde des cookies")
+            self._logged_in_at = time.time()
+            self._save_cookies(client)
+        return result
+
+    async def _reset(self, client: LeMondeAsync | None = None) -> None:
+        if client is not None and client is not self._client:
+            return  # already replaced by a newer client
+        await self._close_client()
+        self._logged_in_at = None
+        self.cookie_file.unlink(missing_ok=True)
+
+    async def _get_client(self) -> LeMondeAsync:
+        if self._client is None:
+            client = LeMondeAsync()
+            await client.__aenter__()
+            self._client = client
+            self._load_cookies(client)
+        return self._client
+
+    async def _close_client(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.__aexit__(None, None, None)
+
+    @staticmethod
+    def _cookie_jar(client: LeMondeAsync) -> aiohttp.CookieJar | None:
+        """Return the aiohttp cookie jar of the client, if it exposes one."""
+        jar = getattr(getattr(client, "session", None), "cookie_jar", None)
+        return jar if isinstance(jar, aiohttp.CookieJar) else None
+
+    def _load_cookies(self, client: LeMondeAsync) -> None:
+        jar = self._cookie_jar(client)
+        if jar is None or not self.cookie_file.exists():
+            return
+        saved_at = self.cookie_file.stat().st_mtime
+        if time.time() - saved_at >= self.max_age:
+            logger.info("Cookies Le Monde trop anciens, nouvelle connexion")
+            return
+        try:
+            jar.load(self.cookie_file)
+        except Exception as exc:  # corrupted / incompatible pickle
+            logger.warning("Impossible de relire les cookies Le Monde : %s", exc)
+            return
+        logger.info("Session Le Monde restaurée depuis %s", self.cookie_file)
+        self._logged_in_at = saved_at
+
+    def _save_cookies(self, client: LeMondeAsync) -> None:
+        jar = self._cookie_jar(client)
+        if jar is None:
+            return
+        self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            jar.save(self.cookie_file)
+        except OSError as exc:
+            logger.warning("Impossible de sauvegarder les cookies Le Monde : %s", exc)
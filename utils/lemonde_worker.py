@@ -0,0 +1,209 @@
+"""Le Monde PDF generation, run inside the processes of a ``ProcessPoolExecutor``.
+
+WeasyPrint rendering is CPU-bound: running it on the bot's event loop blocks the
+discord.py gateway heartbeat. lemonde_sl fetches and renders in the same call
+(``LeMondeAsync.fetch_all_pdf``), so the whole generation is moved to a worker
+process, which keeps its own event loop and its own long-lived
+:class:`~utils.lemonde_session.LeMondeSession` between tasks. The cookie jar is
+shared on disk, so a recycled worker does not have to log in again.
+
+The images of each rendered PDF are then downscaled to the resolution the page
+can display (see ``utils.pdf_tools.optimize_images``), in the worker, so the
+smaller PDF is what travels back to the bot process and into the cache.
+
+The PDFs are read back into memory and deleted by the worker, whatever happens,
+so nothing is left behind in the working directory. Each render runs in its own
+temporary directory under the spill directory (lemonde_sl writes its output in
+the current directory): two renders of the same article, e.g. a hedged retry in
+another worker, never write or delete the same file.
+
+A worker killed from the outside (out of memory...) breaks the whole
+``ProcessPoolExecutor``: :class:`RenderPool` then replaces it and retries.
+
+This module is imported by the worker processes: keep its imports light (no
+discord.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from utils.lemonde_session import LeMondeSession
+from utils.pdf_tools import ImageCache, fit_pdf, optimize_images
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_session: LeMondeSession | None = None
+_image_dpi = 0
+_image_quality = 0
+_image_cache: ImageCache | None = None
+_work_dir = "."
+
+
+@dataclass(frozen=True)
+class RenderedArticle:
+    """A PDF generated by a worker, held in memory."""
+
+    filename: str
+    data: bytes
+    warning: str | None = None
+
+    @property
+    def has_warning(self) -> bool:
+        return bool(self.warning)
+
+
+def create_pool(
+    processes: int,
+    max_tasks_per_child: int,
+    cookie_file: str | Path,
+    session_max_age: float,
+    work_dir: str | Path,
+    image_dpi: int = 0,
+    image_quality: int = 75,
+    image_cache_dir: str | Path | None = None,
+) -> ProcessPoolExecutor:
+    """Create the process pool used to render the articles.
+
+    Args:
+        processes (int): Number of worker processes.
+        max_tasks_per_child (int): Number of articles a worker renders before
+            being replaced by a fresh process (gives the memory back).
+        cookie_file (str | Path): Cookie jar shared by the workers' sessions.
+        session_max_age (float): Maximum age of a login, in seconds.
+        work_dir (str | Path): Working directory of the workers.
+        image_dpi (int): Resolution the images are downscaled to (0: keep them).
+        image_quality (int): JPEG quality of the downscaled images.
+        image_cache_dir (str | Path | None): Cache of the transcoded images.
+    """
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        max_tasks_per_child=max_tasks_per_child,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            str(Path(cookie_file).resolve()),
+            session_max_age,
+            str(work_dir),
+            image_dpi,
+            image_quality,
+            str(Path(image_cache_dir).resolve()) if image_cache_dir else None,
+        ),
+    )
+
+
+class RenderPool:
+    """The render pool, created again when one of its workers dies.
+
+    Args:
+        *args, **kwargs: Arguments of :func:`create_pool`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._args, self._kwargs = args, kwargs
+        self._pool = create_pool(*args, **kwargs)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:  # noqa: UP047
+        """Run ``func(*args)`` in a worker, once more in a new pool if the pool broke."""
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenExecutor:
+            if pool is self._pool:  # not replaced yet by a concurrent call
+                logger.warning("Processus de rendu perdu, redémarrage du pool")
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = create_pool(*self._args, **self._kwargs)
+            return await loop.run_in_executor(self._pool, func, *args)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def render_article(
+    url: str, max_img: int, mobile: bool = False, dark: bool = False
+) -> list[RenderedArticle]:
+    """Fetch and render the PDFs of ``url`` (runs in a worker process).
+
+    The normal layout may be split in several PDFs (``max_img`` images each);
+    the mobile (A6) and dark layouts are rendered as a single PDF.
+    """
+    if _loop is None or _session is None:
+        raise RuntimeError("Le Monde worker not initialized, use create_pool()")
+    articles = []
+    with tempfile.TemporaryDirectory(prefix="render-", dir=_work_dir) as render_dir:
+        os.chdir(render_dir)
+        try:
+            if mobile or dark:
+                articles = [
+                    _loop.run_until_complete(_session.fetch_pdf(url=url, mobile=mobile, dark=dark))
+                ]
+            else:
+                articles = _loop.run_until_complete(
+                    _session.fetch_all_pdf(url=url, max_img=max_img)
+                )
+            rendered = []
+            for article in articles:
+                path = Path(article.path)
+                data = path.read_bytes()
+                if _image_dpi:
+                    data = optimize_images(data, _image_dpi, _image_quality, _image_cache)
+                rendered.append(
+                    RenderedArticle(filename=path.name, data=data, warning=article.warning)
+                )
+        finally:
+            for article in articles:
+                Path(article.path).unlink(missing_ok=True)
+            os.chdir(_work_dir)
+    return rendered
+
+
+def fit_article(article: RenderedArticle, max_bytes: int) -> list[RenderedArticle]:
+    """Recompress, and split if needed, a PDF so each part fits in ``max_bytes``."""
+    parts = fit_pdf(article.data, max_bytes)
+    if len(parts) == 1:
+        return [RenderedArticle(article.filename, parts[0], article.warning)]
+    stem = Path(article.filename).stem
+    return [
+        RenderedArticle(f"{stem}_partie{i}.pdf", part, article.warning if i == 1 else None)
+        for i, part in enumerate(parts, start=1)
+    ]
+
+
+def _init_worker(
+    cookie_file: str,
+    session_max_age: float,
+    work_dir: str,
+    image_dpi: int,
+    image_quality: int,
+    image_cache_dir: str | None,
+) -> None:
+    global _loop, _session, _image_dpi, _image_quality, _image_cache, _work_dir
+    logging.basicConfig(level=logging.INFO)
+    os.makedirs(work_dir, exist_ok=True)
+    _work_dir = os.path.abspath(work_dir)
+    os.chdir(_work_dir)
+    _loop = asyncio.new_event_loop()
+    _session = LeMondeSession(cookie_file, max_age=session_max_age)
+    _image_dpi, _image_quality = image_dpi, image_quality
+    _image_cache = ImageCache(image_cache_dir) if image_cache_dir else None
+    atexit.register(_close_worker)
+
+
+def _close_worker() -> None:
+    if _loop is not None and _session is not None:
+        _loop.run_until_complete(_session.close())
+        _loop.close()
@@ -0,0 +1,273 @@
+"""On-disk, content-addressed cache for the PDFs generated by /lemonde.
+
+Layout of the cache directory::
+
+    <root>/blobs/<sha256>.pdf     PDF content, stored once per distinct content
+    <root>/entries/<key>.json     one entry per article URL (files, warnings, dates)
+
+An entry is valid for ``ttl`` seconds after its creation. The total size of the
+blobs is capped by ``max_bytes``: when a new entry goes over the cap, the least
+recently used entries are evicted (the mtime of the entry file tracks the last
+access, so the LRU order survives a restart).
+
+The cache is thread-safe: ``put`` typically runs in a worker thread while
+``get`` is called from the event loop.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleLike(Protocol):
+    """What the cache needs from a generated article."""
+
+    @property
+    def filename(self) -> str: ...
+
+    @property
+    def data(self) -> bytes: ...
+
+    @property
+    def warning(self) -> str | None: ...
+
+
+@dataclass(frozen=True)
+class CachedArticle:
+    """A PDF served from the cache."""
+
+    path: Path
+    filename: str
+    warning: str | None = None
+
+    @property
+    def has_warning(self) -> bool:
+        return bool(self.warning)
+
+
+@dataclass
+class CacheStats:
+    """Hit / miss counters of a :class:`PdfCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    url: str
+    created: float
+    accessed: float
+    articles: list[dict]
+
+
+def cache_key(url: str) -> str:
+    """Return the file-system safe key of an (already normalized) URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class PdfCache:
+    """Persistent PDF cache with a TTL, a total-size cap and LRU eviction.
+
+    Args:
+        root (str | Path): Cache directory (created if needed).
+        ttl (float): Lifetime of an entry, in seconds.
+        max_bytes (int): Maximum total size of the stored PDFs.
+    """
+
+    def __init__(self, root: str | Path, ttl: float, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self._entries_dir = self.root / "entries"
+        self._blobs_dir = self.root / "blobs"
+        self._entries_dir.mkdir(parents=True, exist_ok=True)
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+
+        # guards the index, the blob sizes and the files (put runs in threads)
+        self._lock = threading.Lock()
+        self._index: dict[str, _Entry] = {}
+        self._blob_sizes: dict[str, int] = {}
+        self._load()
+
+    # ------------------------------------------------------------------ public
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored PDFs, in bytes."""
+        with self._lock:
+            return self._size()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def __contains__(self, url: object) -> bool:
+        """True if ``url`` has a fresh entry (does not count as a hit or a miss)."""
+        if not isinstance(url, str):
+            return False
+        with self._lock:
+            entry = self._index.get(cache_key(url))
+            return entry is not None and time.time() - entry.created <= self.ttl
+
+    def get(self, url: str) -> list[CachedArticle] | None:
+        """Return the cached PDFs of ``url``, or None on a miss (or expired entry)."""
+        with self._lock:
+            return self._get(cache_key(url))
+
+    def _get(self, key: str) -> list[CachedArticle] | None:
+        entry = self._index.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        now = time.time()
+        articles = self._to_articles(entry)
+        if now - entry.created > self.ttl or articles is None:
+            self.stats.expired += 1
+            self.stats.misses += 1
+            self._drop(key)
+            return None
+
+        entry.accessed = now
+        with contextlib.suppress(OSError):
+            os.utime(self._entry_path(key), (now, now))
+        self.stats.hits += 1
+        return articles
+
+    def put(self, url: str, articles: Iterable[ArticleLike]) -> list[CachedArticle]:
+        """Store the generated PDFs of ``url`` and return their cached version."""
+        with self._lock:
+            return self._put(cache_key(url), url, articles)
+
+    def _put(self, key: str, url: str, articles: Iterable[ArticleLike]) -> list[CachedArticle]:
+        records = []
+        for article in articles:
+            digest = self._store_blob(article.data)
+            records.append(
+                {"blob": digest, "filename": article.filename, "warning": article.warning}
+            )
+
+        now = time.time()
+        entry = _Entry(url=url, created=now, accessed=now, articles=records)
+        self._index[key] = entry
+        self._write_entry(key, entry)
+        self._evict(keep=key)
+
+        cached = self._to_articles(entry)
+        return cached if cached is not None else []
+
+    def clear(self) -> None:
+        """Remove every entry and blob."""
+        with self._lock:
+            for key in list(self._index):
+                self._drop(key)
+
+    # ----------------------------------------------------------------- helpers
+
+    def _size(self) -> int:
+        return sum(self._blob_sizes.values())
+
+    def _entry_path(self, key: str) -> Path:
+        return self._entries_dir / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blobs_dir / f"{digest}.pdf"
+
+    def _load(self) -> None:
+        """Rebuild the in-memory index from the cache directory."""
+        for blob in self._blobs_dir.glob("*.pdf"):
+            self._blob_sizes[blob.stem] = blob.stat().st_size
+
+        for path in self._entries_dir.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                entry = _Entry(
+                    url=data["url"],
+                    created=data["created"],
+                    accessed=path.stat().st_mtime,
+                    articles=data["articles"],
+                )
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Entrée de cache illisible %s : %s", path.name, exc)
+                path.unlink(missing_ok=True)
+                continue
+            self._index[path.stem] = entry
+
+        self._remove_orphan_blobs()
+        logger.info("Cache PDF : %d entrées, %d octets", len(self._index), self._size())
+
+    def _write_entry(self, key: str, entry: _Entry) -> None:
+        data = {"url": entry.url, "created": entry.created, "articles": entry.articles}
+        tmp = self._entry_path(key).with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self._entry_path(key))
+
+    def _store_blob(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        dest = self._blob_path(digest)
+        if not dest.exists():
+            tmp = dest.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, dest)
+        self._blob_sizes[digest] = len(data)
+        return digest
+
+    def _to_articles(self, entry: _Entry) -> list[CachedArticle] | None:
+        """Build the cached articles of an entry, or None if a blob is missing."""
+        articles = []
+        for record in entry.articles:
+            if record["blob"] not in self._blob_sizes:
+                return None
+            articles.append(
+                CachedArticle(
+                    path=self._blob_path(record["blob"]),
+                    filename=record["filename"],
+                    warning=record.get("warning"),
+                )
+            )
+        return articles
+
+    def _drop(self, key: str) -> None:
+        self._index.pop(key, None)
+        self._entry_path(key).unlink(missing_ok=True)
+        self._remove_orphan_blobs()
+
+    def _remove_orphan_blobs(self) -> None:
+        used = {r["blob"] for entry in self._index.values() for r in entry.articles}
+        for digest in set(self._blob_sizes) - used:
+            self._blob_path(digest).unlink(missing_ok=True)
+            del self._blob_sizes[digest]
+
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used entries until the cache fits in ``max_bytes``."""
+        by_age = sorted(self._index, key=lambda k: self._index[k].accessed)
+        for key in by_age:
+            if self._size() <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            logger.info("Cache PDF : éviction de %s", self._index[key].url)
+            self._drop(key)
+            self.stats.evictions += 1
@@ -0,0 +1,181 @@
+"""Build ``discord.File`` objects for generated PDFs without temp files in the app directory.
+
+Freshly rendered PDFs are already in memory: they are wrapped in a ``BytesIO``
+(which shares the ``bytes`` buffer, no copy). Cached PDFs are streamed straight
+from their blob file.
+
+A :class:`SpillJanitor` keeps a working directory under a disk quota, whatever
+left files there (crashed renders, killed processes...).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import shutil
+import stat
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Protocol
+
+from discord import File
+
+from utils.pdf_cache import CachedArticle
+
+logger = logging.getLogger(__name__)
+
+# Discord limits (the upload size depends on the guild boost level)
+MAX_ATTACHMENTS = 10
+DEFAULT_UPLOAD_LIMIT = 10 * 1024 * 1024
+
+
+class InMemoryPdf(Protocol):
+    """A rendered PDF held in memory."""
+
+    @property
+    def filename(self) -> str: ...
+
+    @property
+    def data(self) -> bytes: ...
+
+
+def pdf_file(article: CachedArticle | InMemoryPdf) -> File:
+    """Return a ``discord.File`` for a cached or in-memory PDF.
+
+    The caller owns the underlying buffer: close it with :func:`close_files`.
+    """
+    if isinstance(article, CachedArticle):
+        fp: io.BufferedIOBase = open(article.path, "rb")  # noqa: SIM115
+    else:
+        fp = io.BytesIO(article.data)  # shares the bytes, no copy
+    return File(fp, filename=article.filename)
+
+
+def pdf_size(article: CachedArticle | InMemoryPdf) -> int:
+    """Size of a cached or in-memory PDF, in bytes."""
+    if isinstance(article, CachedArticle):
+        return article.path.stat().st_size
+    return len(article.data)
+
+
+def pdf_digest(article: CachedArticle | InMemoryPdf) -> str:
+    """SHA-256 of a cached or in-memory PDF (the blob name of a cached one)."""
+    if isinstance(article, CachedArticle):
+        return article.path.stem
+    return hashlib.sha256(article.data).hexdigest()
+
+
+def pack_attachments(
+    sizes: Sequence[int], max_bytes: int, max_count: int = MAX_ATTACHMENTS
+) -> list[list[int]]:
+    """Group attachments into as few messages as possible.
+
+    First-fit decreasing bin packing: each message holds at most ``max_count``
+    files and ``max_bytes`` bytes (a file bigger than ``max_bytes`` gets its own
+    message). The original order is kept inside and between messages.
+
+    Args:
+        sizes (Sequence[int]): Size of each attachment.
+        max_bytes (int): Maximum total size of a message.
+        max_count (int): Maximum number of attachments of a message.
+
+    Returns:
+        list[list[int]]: Indices (in ``sizes``) of the attachments of each message.
+    """
+    messages: list[list[int]] = []
+    totals: list[int] = []
+    for index in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        for m, message in enumerate(messages):
+            if len(message) < max_count and totals[m] + sizes[index] <= max_bytes:
+                message.append(index)
+                totals[m] += sizes[index]
+                break
+        else:
+            messages.append([index])
+            totals.append(sizes[index])
+    return sorted(sorted(message) for message in messages)
+
+
+def close_files(files: Iterable[File]) -> None:
+    """Close the buffers of files built with :func:`pdf_file`."""
+    for file in files:
+        file.fp.close()
+
+
+class SpillJanitor:
+    """Enforce a disk quota on a spill directory.
+
+    Files older than ``max_age`` are removed, then the oldest files until the
+    directory fits in ``quota_bytes``. A subdirectory (working directory of a
+    render) counts as one entry, as old as its newest file: it is removed once
+    older than ``max_age`` (its render was killed), never to make room, since a
+    render may still be writing into it.
+
+    Args:
+        directory (str | Path): Directory to watch (created if needed).
+        quota_bytes (int): Maximum total size of the directory.
+        max_age (float): Maximum age of a file, in seconds.
+    """
+
+    def __init__(self, directory: str | Path, quota_bytes: int, max_age: float = 3600) -> None:
+        self.directory = Path(directory)
+        self.quota_bytes = quota_bytes
+        self.max_age = max_age
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def sweep(self) -> int:
+        """Clean the directory and return the number of bytes freed."""
+        entries = []
+        for path in self.directory.iterdir():
+            try:
+                entries.append((path, *self._usage(path)))
+            except OSError:  # removed in the meantime
+                continue
+        entries.sort(key=lambda e: e[3])
+
+        now = time.time()
+        total = sum(size for _, _, size, _ in entries)
+        freed = 0
+        for path, is_dir, size, mtime in entries:
+            stale = now - mtime >= self.max_age
+            if total <= self.quota_bytes and not stale:
+                break
+            if is_dir and not stale:
+                continue
+            try:
+                if is_dir:
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except OSError as exc:
+                logger.warning("Janitor : impossible de supprimer %s : %s", path, exc)
+                continue
+            total -= size
+            freed += size
+
+        if freed:
+            logger.info("Janitor : %d octets libérés dans %s", freed, self.directory)
+        return freed
+
+    @staticmethod
+    def _usage(path: Path) -> tuple[bool, int, float]:
+        """Whether ``path`` is a directory, its size and its last modification time.
+
+        The size of a directory is the total size of the files under it, its
+        modification time the latest of its own and of everything under it.
+        """
+        st = path.stat()
+        if not stat.S_ISDIR(st.st_mode):
+            return False, st.st_size, st.st_mtime
+        size, mtime = 0, st.st_mtime
+        for child in path.rglob("*"):
+            try:
+                child_st = child.stat()
+            except OSError:  # removed in the meantime
+                continue
+            if stat.S_ISREG(child_st.st_mode):
+                size += child_st.st_size
+            mtime = max(mtime, child_st.st_mtime)
+        return True, size, mtime
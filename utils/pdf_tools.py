@@ -0,0 +1,283 @@
+"""PDF size reduction helpers: image optimization, recompression and page splitting.
+
+These functions are CPU-bound and meant to run in a worker process (see
+``utils.lemonde_worker``): keep this module free of discord.py imports.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, cast
+
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+)
+
+logger = logging.getLogger(__name__)
+
+# Recompression settings: longest side of the images (pixels) and JPEG quality
+MAX_IMAGE_SIDE = 1200
+JPEG_QUALITY = 60
+
+# Systematic optimization of the rendered PDFs: images are downscaled to this
+# resolution at the size of the page (an image cannot be displayed bigger)
+TARGET_DPI = 150
+TARGET_QUALITY = 75
+
+
+def _write(writer: PdfWriter) -> bytes:
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _transcode(image: Image.Image, max_side: int) -> Image.Image:
+    image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+        # JPEG has no alpha: composite onto the white of the page, not black
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    return image
+
+
+def _to_jpeg(image: Image.Image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _raw(stream: StreamObject) -> bytes:
+    # the stream as stored in the PDF (still encoded): pypdf has no public accessor
+    return stream._data
+
+
+def _feed(digest: Any, value: Any, depth: int = 0) -> None:
+    """Hash a PDF value, following references and streams (without decoding)."""
+    value = value.get_object() if hasattr(value, "get_object") else value
+    if depth > 4:
+        digest.update(b"...")
+    elif isinstance(value, StreamObject):
+        digest.update(_raw(value))
+        _feed(digest, DictionaryObject(value), depth + 1)
+    elif isinstance(value, DictionaryObject):
+        for key in sorted(value):
+            digest.update(key.encode())
+            _feed(digest, value[key], depth + 1)
+    elif isinstance(value, ArrayObject):
+        for item in value:
+            _feed(digest, item, depth + 1)
+    else:
+        digest.update(repr(value).encode())
+
+
+def _image_digest(xobject: StreamObject) -> str:
+    """Hash of an image XObject: its encoded stream, color space, masks..."""
+    digest = hashlib.sha256()
+    _feed(digest, xobject)
+    return digest.hexdigest()
+
+
+def _image_xobjects(resources: Any, seen: set[int]) -> Iterator[StreamObject]:
+    """Yield the image XObjects of a page's resources (and of its forms), once each."""
+    resources = resources.get_object() if resources is not None else None
+    if not isinstance(resources, DictionaryObject) or "/XObject" not in resources:
+        return
+    for reference in cast(DictionaryObject, resources["/XObject"]).values():
+        xobject = reference.get_object()
+        if id(xobject) in seen or not isinstance(xobject, StreamObject):
+            continue
+        seen.add(id(xobject))
+        if xobject.get("/Subtype") == "/Image" and not xobject.get("/ImageMask"):
+            yield xobject
+        elif xobject.get("/Subtype") == "/Form":
+            yield from _image_xobjects(xobject.get("/Resources"), seen)
+
+
+def _set_jpeg(xobject: StreamObject, jpeg: bytes) -> None:
+    """Make an image XObject hold the JPEG ``jpeg`` (opaque, 8 bits per component)."""
+    with Image.open(io.BytesIO(jpeg)) as image:  # only reads the header
+        width, height, mode = image.width, image.height, image.mode
+    for key in ("/DecodeParms", "/Decode", "/SMask", "/Mask", "/Intent"):
+        xobject.pop(key, None)
+    xobject[NameObject("/Filter")] = NameObject("/DCTDecode")
+    xobject[NameObject("/Width")] = NumberObject(width)
+    xobject[NameObject("/Height")] = NumberObject(height)
+    xobject[NameObject("/BitsPerComponent")] = NumberObject(8)
+    xobject[NameObject("/ColorSpace")] = NameObject("/DeviceGray" if mode == "L" else "/DeviceRGB")
+    if isinstance(xobject, EncodedStreamObject):
+        xobject.decoded_self = None
+    xobject._data = jpeg  # set_data() would re-encode with the old filter
+
+
+class ImageCache:
+    """On-disk cache of transcoded images (JPEG), keyed by the hash of the source image.
+
+    The same pictures come back in every layout of an article (normal, mobile,
+    dark), in each re-render after the PDF cache expired, and across articles
+    (logos, author photos...). The source is hashed while still encoded, and a
+    hit is written into the PDF as is: no decoding, resampling or re-encoding.
+    The directory size is kept in check by a ``SpillJanitor``.
+
+    Args:
+        directory (str | Path): Cache directory (created if needed).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(source_digest: str, max_side: int, quality: int) -> str:
+        return f"{source_digest}_{max_side}_{quality}"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return (self.directory / f"{key}.jpg").read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, jpeg: bytes) -> None:
+        path = self.directory / f"{key}.jpg"
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(jpeg)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Image %s non mise en cache : %s", key, exc)
+
+
+def optimize_images(
+    data: bytes,
+    dpi: int = TARGET_DPI,
+    quality: int = TARGET_QUALITY,
+    cache: ImageCache | None = None,
+) -> bytes:
+    """Downscale the images of a PDF to ``dpi`` at the page size, and re-encode them.
+
+    Only the images bigger than what the page can display are transcoded (their
+    size is read from the PDF, without decoding them). Transparent images are
+    flattened onto white.
+
+    Args:
+        data (bytes): The PDF.
+        dpi (int): Target resolution, in pixels per inch of the page.
+        quality (int): JPEG quality of the re-encoded images.
+        cache (ImageCache | None): Cache of the already transcoded images.
+
+    Returns:
+        bytes: The optimized PDF (or ``data`` if it did not get smaller).
+    """
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(data)))
+    transcoded = 0
+    seen: set[int] = set()
+    for page in writer.pages:
+        # longest side of the page in inches (1 pt = 1/72 in)
+        max_side = round(max(page.mediabox.width, page.mediabox.height) / 72 * dpi)
+        for xobject in _image_xobjects(page.get("/Resources"), seen):
+            try:
+                if max(cast(int, xobject["/Width"]), cast(int, xobject["/Height"])) <= max_side:
+                    continue
+                key = ImageCache.key(_image_digest(xobject), max_side, quality)
+                jpeg = cache.get(key) if cache is not None else None
+                if jpeg is None:
+                    image = xobject.decode_as_image()
+                    if image is None:
+                        continue
+                    jpeg = _to_jpeg(_transcode(image, max_side), quality)
+                    if cache is not None:
+                        cache.put(key, jpeg)
+                _set_jpeg(xobject, jpeg)
+                transcoded += 1
+            except Exception as exc:  # unusual color spaces, masks...
+                logger.debug("Image non optimisée : %s", exc)
+        page.compress_content_streams()
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+    result = _write(writer)
+    logger.info("PDF optimisé (%d images) : %d -> %d octets", transcoded, len(data), len(result))
+    return result if len(result) < len(data) else data
+
+
+def recompress_pdf(
+    data: bytes, max_side: int = MAX_IMAGE_SIDE, quality: int = JPEG_QUALITY
+) -> bytes:
+    """Downsample and re-encode the images of a PDF, and compress its streams.
+
+    Args:
+        data (bytes): The PDF.
+        max_side (int): Longest side of the images after downsampling, in pixels.
+        quality (int): JPEG quality of the re-encoded images.
+
+    Returns:
+        bytes: The recompressed PDF (or ``data`` if it did not get smaller).
+    """
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(data)))
+    for page in writer.pages:
+        for image_file in page.images:
+            image = image_file.image
+            if image is None:
+                continue
+            try:
+                image_file.replace(_transcode(image, max_side), quality=quality)
+            except Exception as exc:  # unusual color spaces, masks...
+                logger.debug("Image %s non recompressée : %s", image_file.name, exc)
+        page.compress_content_streams()
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+    result = _write(writer)
+    logger.info("PDF recompressé : %d -> %d octets", len(data), len(result))
+    return result if len(result) < len(data) else data
+
+
+def split_pdf(data: bytes, max_bytes: int) -> list[bytes]:
+    """Split a PDF into consecutive parts of at most ``max_bytes`` each.
+
+    Page ranges are halved until each part fits. A single page larger than
+    ``max_bytes`` is returned as is.
+    """
+    reader = PdfReader(io.BytesIO(data))
+    parts: list[bytes] = []
+
+    def split(start: int, end: int) -> None:
+        writer = PdfWriter()
+        for index in range(start, end):
+            writer.add_page(reader.pages[index])
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+        part = _write(writer)
+        if len(part) <= max_bytes or end - start == 1:
+            if len(part) > max_bytes:
+                logger.warning("Page %d trop lourde (%d octets)", start + 1, len(part))
+            parts.append(part)
+            return
+        middle = (start + end) // 2
+        split(start, middle)
+        split(middle, end)
+
+    split(0, len(reader.pages))
+    return parts
+
+
+def fit_pdf(data: bytes, max_bytes: int) -> list[bytes]:
+    """Make a PDF fit in ``max_bytes``: recompress it, then split it if needed."""
+    if len(data) <= max_bytes:
+        return [data]
+    data = recompress_pdf(data)
+    if len(data) <= max_bytes:
+        return [data]
+    return split_pdf(data, max_bytes)
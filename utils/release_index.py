@@ -0,0 +1,153 @@
+"""Local SQLite index of the jeuxvideo.com release calendar.
+
+A background job crawls the month pages of each platform and stores the games
+here, one set of rows per crawled ``(platform, year, month)``. A day, week,
+month or quarter query is then an indexed range scan on ``(platform, date_end)``
+instead of a scrape. A partial release date ("Octobre 2026") is stored as the
+period ``date``..``date_end``, and listed by the windows holding its last day,
+like the scrape does (see ``NewGame.released_between``). Each crawled month
+records when it was last updated, so the answers can show how fresh they are.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+Day = date  # the classes below have a ``date`` field, which shadows the type
+
+SCHEMA_VERSION = 3  # the index is a cache: rebuilt from scratch on change
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    platform TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    date_end TEXT NOT NULL,
+    name TEXT NOT NULL,
+    release TEXT,
+    platforms TEXT NOT NULL,
+    part_url TEXT
+);
+CREATE INDEX IF NOT EXISTS games_platform_date_end ON games (platform, date_end);
+CREATE INDEX IF NOT EXISTS games_crawl ON games (platform, year, month);
+CREATE TABLE IF NOT EXISTS months (
+    platform TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (platform, year, month)
+);
+"""
+
+
+@dataclass(frozen=True)
+class IndexedRelease:
+    """A game stored in the index."""
+
+    name: str
+    release: str | None
+    platforms: str
+    part_url: str | None
+    date: date
+    date_end: Day
+
+
+class ReleaseIndex:
+    """Release dates by platform, persisted in a SQLite file.
+
+    The methods are blocking (but fast): call them with ``asyncio.to_thread``.
+
+    Args:
+        path (str | Path): SQLite file of the index.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            (version,) = self._db.execute("PRAGMA user_version").fetchone()
+            if version != SCHEMA_VERSION:
+                self._db.executescript("DROP TABLE IF EXISTS games; DROP TABLE IF EXISTS months;")
+                self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def replace_month(
+        self, platform: str, year: int, month: int, games: Iterable[IndexedRelease]
+    ) -> None:
+        """Replace the games crawled for a month (in one transaction)."""
+        rows = [
+            (platform, year, month, position, game.date.isoformat(), game.date_end.isoformat())
+            + (game.name, game.release, game.platforms, game.part_url)
+            for position, game in enumerate(games)
+        ]
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM games WHERE platform = ? AND year = ? AND month = ?",
+                (platform, year, month),
+            )
+            self._db.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO months VALUES (?, ?, ?, ?)",
+                (platform, year, month, time.time()),
+            )
+        logger.debug("Index : %s %02d/%d, %d jeux", platform, month, year, len(rows))
+
+    def prune(self, year: int, month: int) -> None:
+        """Drop the months crawled before ``month``/``year``."""
+        with self._lock, self._db:
+            for table in ("games", "months"):
+                self._db.execute(
+                    f"DELETE FROM {table} WHERE year * 12 + month < ?",
+                    (year * 12 + month,),
+                )
+
+    def updated(self, platform: str, months: Iterable[tuple[int, int]]) -> float | None:
+        """Oldest update time of the ``(month, year)`` crawls, None if one is missing."""
+        oldest = None
+        with self._lock:
+            for month, year in months:
+                row = self._db.execute(
+                    "SELECT updated FROM months WHERE platform = ? AND year = ? AND month = ?",
+                    (platform, year, month),
+                ).fetchone()
+                if row is None:
+                    return None
+                oldest = row[0] if oldest is None else min(oldest, row[0])
+        return oldest
+
+    def between(self, platform: str, start: date, end: date) -> list[IndexedRelease]:
+        """Games of ``platform`` released (or ending their period) from ``start`` to ``end``."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT name, release, platforms, part_url, date, date_end FROM games"
+                " WHERE platform = ? AND date_end BETWEEN ? AND ?"
+                " ORDER BY date_end, year, month, position",
+                (platform, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [
+            IndexedRelease(
+                name,
+                release,
+                platforms,
+                part_url,
+                date.fromisoformat(first),
+                date.fromisoformat(last),
+            )
+            for name, release, platforms, part_url, first, last in rows
+        ]
@@ -0,0 +1,348 @@
+"""Bounded, fair-share job queue for expensive bot commands (PDF generation...)."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Called with (position in the queue, estimated wait in seconds); position 0 = started
+OnUpdate = Callable[[int, float], Awaitable[None]]
+
+
+class SchedulerError(Exception):
+    """Base class for the errors raised when a job is refused."""
+
+
+class QueueFullError(SchedulerError):
+    """Raised when the queue already holds its maximum number of jobs."""
+
+
+class UserLimitError(SchedulerError):
+    """Raised when a user already has too many jobs queued or running."""
+
+
+@dataclass(eq=False)
+class _Job:
+    guild_id: int
+    user_id: int
+    func: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    on_update: OnUpdate | None = None
+    position: int = field(default=-1)
+    background: bool = False
+    tag: Hashable | None = None  # lets a background job be found and promoted
+    # progress: the update being sent, and the latest one waiting to be sent
+    updater: asyncio.Task | None = None
+    pending: tuple[int, float] | None = None
+
+
+class FairScheduler:
+    """Run jobs with a fixed number of workers, in fair-share order.
+
+    Waiting jobs are served round-robin between guilds, then round-robin between
+    the users of a guild, so a burst from one user (or one server) cannot starve
+    the others. The queue is bounded, and each user can only have
+    ``max_per_user`` jobs queued or running at once.
+
+    Background jobs (prefetching...) only run when no regular job is waiting,
+    unless a user needs one of them: it can then be promoted to a regular job.
+
+    Progress updates are sent in the background, at most one at a time per job
+    (only the latest position is kept), so a slow Discord edit never delays
+    the start of a job.
+
+    Args:
+        workers (int): Number of jobs run concurrently.
+        max_queue (int): Maximum number of waiting jobs.
+        max_per_user (int): Maximum number of queued + running jobs per user.
+        default_duration (float): Initial estimate of a job duration (seconds),
+            refined with an exponential moving average of the real durations.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue: int,
+        max_per_user: int,
+        default_duration: float = 20.0,
+    ) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_per_user = max_per_user
+        self.avg_duration = default_duration
+
+        self._guilds: deque[int] = deque()  # guild round-robin
+        self._users: dict[int, deque[int]] = {}  # guild -> users round-robin
+        self._jobs: dict[tuple[int, int], deque[_Job]] = {}  # (guild, user) -> jobs
+        self._per_user: dict[int, int] = {}  # user -> queued + running
+        self._queued = 0
+        self._background: deque[_Job] = deque()  # low priority, FIFO
+        self._running = 0
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._updaters: set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------ public
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def start(self) -> None:
+        """Start the worker tasks (must be called from a running event loop)."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(), name=f"scheduler-worker-{i}")
+                for i in range(self.workers)
+            ]
+
+    async def close(self) -> None:
+        """Stop the workers and cancel the waiting jobs."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        for job in [*self._iter_jobs(), *self._background]:
+            job.future.cancel()
+        for task in self._updaters:
+            task.cancel()
+
+    async def submit(  # noqa: UP047
+        self,
+        guild_id: int,
+        user_id: int,
+        func: Callable[[], Awaitable[T]],
+        on_update: OnUpdate | None = None,
+    ) -> T:
+        """Queue ``func()`` and return its result once a worker has run it.
+
+        Raises:
+            QueueFullError: The queue is full.
+            UserLimitError: The user already has ``max_per_user`` jobs in flight.
+        """
+        if self._per_user.get(user_id, 0) >= self.max_per_user:
+            raise UserLimitError(
+                f"Tu as déjà {self.max_per_user} demande(s) en cours, attends qu'elles finissent."
+            )
+        if self._queued >= self.max_queue:
+            raise QueueFullError("File d'attente pleine, réessaie dans quelques minutes.")
+
+        self.start()
+        job = _Job(guild_id, user_id, func, asyncio.get_running_loop().create_future(), on_update)
+        self._enqueue(job)
+        self._notify()
+        result: T = await self._wait(job)
+        return result
+
+    async def submit_background(  # noqa: UP047
+        self, func: Callable[[], Awaitable[T]], tag: Hashable | None = None
+    ) -> T:
+        """Queue a low-priority ``func()``, run only when no regular job is waiting.
+
+        Args:
+            func: The job.
+            tag: Identifies the job for :meth:`promote`.
+
+        Raises:
+            QueueFullError: The background queue is full.
+        """
+        if len(self._background) >= self.max_queue:
+            raise QueueFullError("File d'attente de fond pleine.")
+
+        self.start()
+        job = _Job(0, 0, func, asyncio.get_running_loop().create_future(), background=True)
+        job.tag = tag
+        self._background.append(job)
+        self._wakeup.set()
+        result: T = await self._wait(job)
+        return result
+
+    def promote(
+        self, tag: Hashable, guild_id: int, user_id: int, on_update: OnUpdate | None = None
+    ) -> bool:
+        """Move the waiting background job ``tag`` to the regular queue, for this user.
+
+        The job then takes its fair-share turn like a job submitted by the user
+        (and counts in the user's quota), and reports its position to ``on_update``.
+
+        Returns:
+            bool: False if there is no such waiting job (not queued, already
+            running...) or if the user has no quota left.
+        """
+        job = next((j for j in self._background if j.tag == tag), None)
+        if job is None or self._per_user.get(user_id, 0) >= self.max_per_user:
+            return False
+        self._background.remove(job)
+        job.background = False
+        job.guild_id, job.user_id, job.on_update = guild_id, user_id, on_update
+        self._enqueue(job)
+        self._notify()
+        return True
+
+    def eta(self, position: int) -> float:
+        """Estimated wait (seconds) of the job at ``position`` (1-based) in the queue."""
+        return math.ceil(position / self.workers) * self.avg_duration
+
+    # ----------------------------------------------------------------- helpers
+
+    async def _wait(self, job: _Job) -> Any:
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            self._discard(job)
+            raise
+        finally:
+            # the caller moves on: no late "position n" over its next messages
+            job.pending = None
+            if job.updater is not None:
+                job.updater.cancel()
+
+    def _enqueue(self, job: _Job) -> None:
+        key = (job.guild_id, job.user_id)
+        if job.guild_id not in self._users:
+            self._users[job.guild_id] = deque()
+            self._guilds.append(job.guild_id)
+        if key not in self._jobs:
+            self._jobs[key] = deque()
+            self._users[job.guild_id].append(job.user_id)
+        self._jobs[key].append(job)
+        self._per_user[job.user_id] = self._per_user.get(job.user_id, 0) + 1
+        self._queued += 1
+        self._wakeup.set()
+
+    def _pop(self) -> _Job:
+        """Take the next job in fair-share order (the queue must not be empty)."""
+        guild = self._guilds.popleft()
+        users = self._users[guild]
+        user = users.popleft()
+        jobs = self._jobs[(guild, user)]
+        job = jobs.popleft()
+
+        if jobs:
+            users.append(user)
+        else:
+            del self._jobs[(guild, user)]
+        if users:
+            self._guilds.append(guild)
+        else:
+            del self._users[guild]
+        self._queued -= 1
+        return job
+
+    def _discard(self, job: _Job) -> None:
+        """Forget a job cancelled by its caller (queued or running)."""
+        if job.background:
+            if job in self._background:
+                self._background.remove(job)
+            return
+        jobs = self._jobs.get((job.guild_id, job.user_id))
+        if jobs and job in jobs:
+            jobs.remove(job)
+            self._queued -= 1
+            self._release(job)
+            if not jobs:
+                del self._jobs[(job.guild_id, job.user_id)]
+                users = self._users[job.guild_id]
+                users.remove(job.user_id)
+                if not users:
+                    del self._users[job.guild_id]
+                    self._guilds.remove(job.guild_id)
+
+    def _release(self, job: _Job) -> None:
+        if job.background:
+            return
+        count = self._per_user.get(job.user_id, 0) - 1
+        if count > 0:
+            self._per_user[job.user_id] = count
+        else:
+            self._per_user.pop(job.user_id, None)
+
+    def _iter_jobs(self) -> Iterator[_Job]:
+        """Yield the waiting jobs in the order they will be run (without popping them)."""
+        guilds = deque(self._guilds)
+        users = {g: deque(u) for g, u in self._users.items()}
+        jobs = {k: deque(j) for k, j in self._jobs.items()}
+        while guilds:
+            guild = guilds.popleft()
+            user = users[guild].popleft()
+            yield jobs[(guild, user)].popleft()
+            if jobs[(guild, user)]:
+                users[guild].append(user)
+            if users[guild]:
+                guilds.append(guild)
+
+    def _notify(self) -> None:
+        """Send their new position to the waiting jobs whose position changed."""
+        for position, job in enumerate(list(self._iter_jobs()), start=1):
+            if job.position != position:
+                job.position = position
+                self._post(job, position, self.eta(position))
+
+    def _post(self, job: _Job, position: int, eta: float) -> None:
+        """Send a progress update in the background, coalesced with the pending one."""
+        if job.on_update is None:
+            return
+        job.pending = (position, eta)
+        if job.updater is None or job.updater.done():
+            job.updater = asyncio.create_task(self._send_updates(job))
+            self._updaters.add(job.updater)
+            job.updater.add_done_callback(self._updaters.discard)
+
+    @staticmethod
+    async def _send_updates(job: _Job) -> None:
+        while job.pending is not None and job.on_update is not None:
+            position, eta = job.pending
+            job.pending = None
+            try:
+                await job.on_update(position, eta)
+            except Exception as exc:  # a failed progress message must not kill the job
+                logger.warning("Scheduler : échec de la mise à jour de position : %s", exc)
+
+    async def _worker(self) -> None:
+        while True:
+            while not self._queued and not self._background:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            job = self._pop() if self._queued else self._background.popleft()
+            if job.future.done():  # cancelled while waiting
+                self._release(job)
+                continue
+
+            self._running += 1
+            self._post(job, 0, 0.0)
+            self._notify()
+            start = time.monotonic()
+            try:
+                result = await job.func()
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as exc:
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            else:
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._running -= 1
+                self._release(job)
+                elapsed = time.monotonic() - start
+                self.avg_duration = 0.8 * self.avg_duration + 0.2 * elapsed
@@ -0,0 +1,49 @@
+"""Coalescing of concurrent identical async calls ("single-flight")."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight(Generic[K, T]):  # noqa: UP046
+    """Run at most one call per key at a time and share its result.
+
+    The first caller for a key starts the work; callers arriving while it is
+    running await the same task and get the same result (or exception).
+    A caller being cancelled does not cancel the shared work for the others.
+
+    Example:
+        flight = SingleFlight[str, bytes]()
+        data = await flight.do(url, lambda: download(url))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Task[T]] = {}
+
+    def in_flight(self, key: K) -> bool:
+        """Return True if a call for ``key`` is currently running."""
+        return key in self._calls
+
+    async def do(self, key: K, func: Callable[[], Awaitable[T]]) -> T:
+        """Await the running call for ``key``, or start ``func()`` if there is none."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            logger.info("Single-flight : appel déjà en cours pour %s, on attend", key)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # retrieve the exception so an unawaited failure is not reported as lost
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,99 @@
+"""In-memory async cache with stale-while-revalidate."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from utils.singleflight import SingleFlight
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class SWRCache(Generic[K, T]):  # noqa: UP046
+    """Cache the results of an async loader, serving stale values while refreshing.
+
+    A value younger than ``ttl`` is returned as is. A value between ``ttl`` and
+    ``max_stale`` is returned immediately too, and reloaded in the background
+    for the next callers. Older (or missing) values are loaded before
+    returning. Concurrent loads of the same key are coalesced.
+
+    Args:
+        ttl (float): Freshness of a value, in seconds.
+        max_stale (float): Maximum age of a value served while refreshing, in seconds.
+
+    Example:
+        months = SWRCache[tuple[str, int, int], list[NewGame]](ttl=3600, max_stale=86400)
+        games = await months.get(key, lambda: fetch_month(url))
+    """
+
+    def __init__(self, ttl: float, max_stale: float) -> None:
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._values: dict[K, tuple[float, T]] = {}
+        self._flight: SingleFlight[K, T] = SingleFlight()
+        self._refreshes: set[asyncio.Task] = set()
+
+    def __contains__(self, key: object) -> bool:
+        """True if ``key`` can be served without waiting for a load."""
+        return self.peek(key) is not None  # type: ignore[arg-type]
+
+    def peek(self, key: K) -> T | None:
+        """Return the value of ``key`` if it can be served without a load, else None."""
+        entry = self._values.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.max_stale:
+            return None
+        return entry[1]
+
+    def invalidate(self, key: K) -> None:
+        self._values.pop(key, None)
+
+    async def get(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[T]],
+        accept: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Return the value of ``key``, calling ``loader()`` when it is missing or stale.
+
+        A cached value rejected by ``accept`` (e.g. a partial result that does not
+        cover the request) is loaded again, as if it was missing.
+        """
+        entry = self._values.get(key)
+        if entry is not None and (accept is None or accept(entry[1])):
+            loaded_at, value = entry
+            age = time.monotonic() - loaded_at
+            if age <= self.ttl:
+                return value
+            if age <= self.max_stale:
+                self._refresh(key, loader)
+                return value
+        value = await self._load(key, loader)
+        if accept is not None and not accept(value):  # joined a narrower load in flight
+            value = await self._load(key, loader)
+        return value
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[T]]) -> T:
+        async def load() -> T:
+            value = await loader()
+            self._values[key] = (time.monotonic(), value)
+            return value
+
+        return await self._flight.do(key, load)
+
+    def _refresh(self, key: K, loader: Callable[[], Awaitable[T]]) -> None:
+        if self._flight.in_flight(key):
+            return
+        logger.info("Cache SWR : rafraîchissement de %s en arrière-plan", key)
+        task = asyncio.create_task(self._load(key, loader))
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshed)
+
+    def _refreshed(self, task: asyncio.Task) -> None:
+        self._refreshes.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.warning("Cache SWR : échec du rafraîchissement : %s", exc)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from urllib.parse import urlsplit, urlunsplit
 
 from bs4 import Tag
 
@@ -48,6 +49,27 @@ def text_or_none(tag: Tag | None) -> str | None:
     return tag.get_text(strip=True) if tag else None
 
 
+def canonical_url(url: str) -> str:
+    """Normalise une URL pour que deux liens vers la même page aient la même clé.
+
+    Le schéma est forcé en https, l'hôte est mis en minuscules, la query-string
+    (tracking, partage...) et le fragment sont supprimés.
+
+    Paramètres :
+        url (str) : L'URL telle que collée par l'utilisateur.
+
+    Retour :
+        str : L'URL canonique.
+    """
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        parts = urlsplit(f"https://{url}")
+    host = (parts.hostname or "").lower()
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, "", ""))
+
+
 def setup_logger(name: str, level: int | str = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
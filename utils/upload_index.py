@@ -0,0 +1,100 @@
+"""Remember where the /lemonde PDFs were uploaded, to point to them again.
+
+Each record ties a channel and an article (cache key) to the messages holding
+its PDFs and to the hash of each PDF. A repeat request in the same channel can
+then get a link to the existing upload instead of megabytes of PDF uploaded
+again. The records are persisted to a small JSON file so they survive a restart.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UploadRecord:
+    """The messages of a successful /lemonde upload."""
+
+    channel_id: int
+    message_ids: tuple[int, ...]
+    jump_url: str
+    digests: tuple[str, ...]  # sha256 of the uploaded PDFs (before fitting)
+    uploaded: float
+
+
+class UploadIndex:
+    """Persistent ``(channel, article) -> UploadRecord`` map.
+
+    Args:
+        path (str | Path): JSON file of the index.
+        max_age (float): Records older than this (seconds) are not reused.
+        max_entries (int): Maximum number of records (the oldest are dropped).
+    """
+
+    def __init__(self, path: str | Path, max_age: float, max_entries: int = 1000) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._records: dict[str, UploadRecord] = {}
+        self._load()
+
+    @staticmethod
+    def _key(channel_id: int, article: str) -> str:
+        return f"{channel_id} {article}"
+
+    def get(self, channel_id: int, article: str) -> UploadRecord | None:
+        """Return the last upload of ``article`` in the channel, if recent enough."""
+        record = self._records.get(self._key(channel_id, article))
+        if record is None or time.time() - record.uploaded > self.max_age:
+            return None
+        return record
+
+    def put(self, article: str, record: UploadRecord) -> None:
+        """Record an upload of ``article`` (replaces the previous one of the channel)."""
+        key = self._key(record.channel_id, article)
+        self._records.pop(key, None)
+        self._records[key] = record
+        while len(self._records) > self.max_entries:  # dicts keep insertion order
+            del self._records[next(iter(self._records))]
+        self._save()
+
+    def discard(self, channel_id: int, article: str) -> None:
+        """Forget an upload whose messages are gone."""
+        if self._records.pop(self._key(channel_id, article), None) is not None:
+            self._save()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._records = {
+                key: UploadRecord(
+                    channel_id=r["channel_id"],
+                    message_ids=tuple(r["message_ids"]),
+                    jump_url=r["jump_url"],
+                    digests=tuple(r["digests"]),
+                    uploaded=r["uploaded"],
+                )
+                for key, r in data.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Index des envois illisible %s : %s", self.path, exc)
+            self._records = {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {key: asdict(record) for key, record in self._records.items()}
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.warning("Impossible de sauvegarder l'index des envois : %s", exc)